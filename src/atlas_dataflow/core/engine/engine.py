@@ -2,7 +2,7 @@
 """
 Engine de execução do pipeline do Atlas DataFlow.
 
-Correção (compatibilidade com StepResult frozen dataclass):
+Correção (StepResult é imutável por contrato):
 - O Engine **não** muta instâncias de StepResult in-place.
 - Qualquer enriquecimento (warnings/impact/payload_meta) é feito via
   criação de uma **nova** instância (dataclasses.replace).
@@ -71,6 +71,22 @@ ENGINE_EXECUTION_ERROR = "ENGINE_EXECUTION_ERROR"
 ENGINE_CONFIGURATION_ERROR = "ENGINE_CONFIGURATION_ERROR"
 
 
+# ---------------------------------------------------------------------------
+# Hints canônicos (fonte única do texto de ação sugerida)
+# ---------------------------------------------------------------------------
+
+_HINT_MISSING_COLUMN = "Declare a coluna ausente no contrato ou ajuste o dataset para conter a feature obrigatória."
+_HINT_EXTRA_COLUMN = "Remova a coluna extra do dataset ou ajuste o contrato para permitir explicitamente essa feature."
+_HINT_INVALID_DTYPE = "Ajuste o tipo da coluna no dataset ou atualize o contrato para refletir o dtype correto."
+_HINT_CATEGORY_OUT_OF_DOMAIN = "Ajuste os valores categóricos no dataset ou atualize o domínio permitido no contrato."
+_HINT_DECISION_REQUIRED = "Declare explicitamente a decisão no contrato ou configuração indicada antes de reexecutar o pipeline."
+_HINT_PREPROCESS_NOT_FOUND = "Execute o Step de preprocessamento correspondente ou ajuste o pipeline para não depender desse artefato."
+_HINT_MODEL_NOT_FOUND = "Execute o Step de treino/seleção de modelo ou ajuste o pipeline para produzir o artefato esperado antes da inferência."
+_HINT_MANIFEST_NOT_FOUND = "Garanta que o pipeline foi inicializado corretamente e que o manifest foi gerado antes da execução deste Step."
+_HINT_ENGINE_EXECUTION_ERROR = "Verifique o stacktrace e os artefatos do run para diagnosticar a falha. Nenhum fallback é aplicado automaticamente."
+_HINT_ENGINE_CONFIGURATION_ERROR = "Revise a configuração do run/steps e declare explicitamente as opções necessárias antes de reexecutar."
+
+
 # ---------------------------------------------------------------------------
 # Helpers de fábrica (opcional, mas recomendado)
 # ---------------------------------------------------------------------------
@@ -80,7 +96,7 @@ def contract_missing_column(
     missing_columns: List[str],
     step: Optional[str] = None,
     contract_section: str = "features.required",
-    hint: str = "Declare a coluna ausente no contrato ou ajuste o dataset para conter a feature obrigatória.",
+    hint: str = _HINT_MISSING_COLUMN,
     decision_required: bool = False,
 ) -> AtlasErrorPayload:
     return AtlasErrorPayload(
@@ -101,7 +117,7 @@ def contract_extra_column(
     extra_columns: List[str],
     step: Optional[str] = None,
     contract_section: str = "features.forbidden",
-    hint: str = "Remova a coluna extra do dataset ou ajuste o contrato para permitir explicitamente essa feature.",
+    hint: str = _HINT_EXTRA_COLUMN,
     decision_required: bool = False,
 ) -> AtlasErrorPayload:
     return AtlasErrorPayload(
@@ -124,7 +140,7 @@ def contract_invalid_dtype(
     actual_dtype: str,
     step: Optional[str] = None,
     contract_section: str = "features.dtypes",
-    hint: str = "Ajuste o tipo da coluna no dataset ou atualize o contrato para refletir o dtype correto.",
+    hint: str = _HINT_INVALID_DTYPE,
     decision_required: bool = False,
 ) -> AtlasErrorPayload:
     return AtlasErrorPayload(
@@ -149,7 +165,7 @@ def contract_category_out_of_domain(
     allowed_categories: List[Any],
     step: Optional[str] = None,
     contract_section: str = "features.domain",
-    hint: str = "Ajuste os valores categóricos no dataset ou atualize o domínio permitido no contrato.",
+    hint: str = _HINT_CATEGORY_OUT_OF_DOMAIN,
     decision_required: bool = False,
 ) -> AtlasErrorPayload:
     return AtlasErrorPayload(
@@ -173,7 +189,7 @@ def contract_decision_required(
     options: List[str],
     step: Optional[str] = None,
     contract_section: Optional[str] = None,
-    hint: str = "Declare explicitamente a decisão no contrato ou configuração indicada antes de reexecutar o pipeline.",
+    hint: str = _HINT_DECISION_REQUIRED,
 ) -> AtlasErrorPayload:
     return AtlasErrorPayload(
         type=CONTRACT_DECISION_REQUIRED,
@@ -195,7 +211,7 @@ def preprocess_not_found(
     step: Optional[str] = None,
     required_by: Optional[str] = None,
     artifact_namespace: str = "artifacts",
-    hint: str = "Execute o Step de preprocessamento correspondente ou ajuste o pipeline para não depender desse artefato.",
+    hint: str = _HINT_PREPROCESS_NOT_FOUND,
 ) -> AtlasErrorPayload:
     return AtlasErrorPayload(
         type=PREPROCESS_NOT_FOUND,
@@ -217,7 +233,7 @@ def model_not_found(
     step: Optional[str] = None,
     required_by: Optional[str] = None,
     artifact_namespace: str = "artifacts",
-    hint: str = "Execute o Step de treino/seleção de modelo ou ajuste o pipeline para produzir o artefato esperado antes da inferência.",
+    hint: str = _HINT_MODEL_NOT_FOUND,
 ) -> AtlasErrorPayload:
     return AtlasErrorPayload(
         type=MODEL_NOT_FOUND,
@@ -239,7 +255,7 @@ def manifest_not_found(
     step: Optional[str] = None,
     required_by: Optional[str] = None,
     artifact_namespace: str = "run_dir",
-    hint: str = "Garanta que o pipeline foi inicializado corretamente e que o manifest foi gerado antes da execução deste Step.",
+    hint: str = _HINT_MANIFEST_NOT_FOUND,
 ) -> AtlasErrorPayload:
     return AtlasErrorPayload(
         type=MANIFEST_NOT_FOUND,
@@ -260,7 +276,7 @@ def engine_execution_error(
     step: Optional[str] = None,
     exc_type: Optional[str] = None,
     exc_message: Optional[str] = None,
-    hint: str = "Verifique o stacktrace e os artefatos do run para diagnosticar a falha. Nenhum fallback é aplicado automaticamente.",
+    hint: str = _HINT_ENGINE_EXECUTION_ERROR,
 ) -> AtlasErrorPayload:
     return AtlasErrorPayload(
         type=ENGINE_EXECUTION_ERROR,
@@ -279,7 +295,7 @@ def engine_configuration_error(
     *,
     message: str = "Configuração inválida para execução do pipeline",
     details: Optional[Dict[str, Any]] = None,
-    hint: str = "Revise a configuração do run/steps e declare explicitamente as opções necessárias antes de reexecutar.",
+    hint: str = _HINT_ENGINE_CONFIGURATION_ERROR,
 ) -> AtlasErrorPayload:
     return AtlasErrorPayload(
         type=ENGINE_CONFIGURATION_ERROR,
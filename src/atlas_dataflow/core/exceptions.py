@@ -16,11 +16,9 @@ Regras:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 
-@dataclass(frozen=True)
 class AtlasException(Exception):
     """Base class para exceções internas do Atlas.
 
@@ -28,12 +26,24 @@ class AtlasException(Exception):
     - Sempre carregar dados estruturados em `details`
     - Não embedar stack trace em payloads de erro
     - Mensagem deve ser curta e humana
+
+    Implementada como classe simples (sem dataclass) para que
+    `BaseException.args` seja inicializado normalmente e o custo de
+    raise/catch não inclua a maquinaria de dataclass congelada.
     """
 
-    message: str
-    details: Dict[str, Any]
-    hint: Optional[str] = None
-    decision_required: bool = False
+    def __init__(
+        self,
+        message: str,
+        details: Dict[str, Any],
+        hint: Optional[str] = None,
+        decision_required: bool = False,
+    ) -> None:
+        super().__init__(message)
+        self.message = message
+        self.details = details
+        self.hint = hint
+        self.decision_required = decision_required
 
     def __str__(self) -> str:  # pragma: no cover
         return self.message
@@ -43,22 +53,18 @@ class AtlasException(Exception):
 # Contrato / Conformidade
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
 class ContractMissingColumn(AtlasException):
     """Coluna requerida pelo contrato não existe no dataset."""
 
 
-@dataclass(frozen=True)
 class ContractExtraColumn(AtlasException):
     """Coluna existe no dataset, mas não está declarada no contrato."""
 
 
-@dataclass(frozen=True)
 class ContractInvalidDtype(AtlasException):
     """Tipo de dado no dataset não bate com o dtype esperado pelo contrato."""
 
 
-@dataclass(frozen=True)
 class ContractCategoryOutOfDomain(AtlasException):
     """Valor categórico está fora do domínio declarado no contrato."""
 
@@ -67,17 +73,14 @@ class ContractCategoryOutOfDomain(AtlasException):
 # Artefatos obrigatórios
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
 class PreprocessNotFound(AtlasException):
     """Preprocess obrigatório não foi encontrado."""
 
 
-@dataclass(frozen=True)
 class ModelNotFound(AtlasException):
     """Modelo obrigatório não foi encontrado."""
 
 
-@dataclass(frozen=True)
 class ManifestNotFound(AtlasException):
     """Manifest obrigatório não foi encontrado."""
 
@@ -86,11 +89,9 @@ class ManifestNotFound(AtlasException):
 # Engine / Configuração
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
 class EngineConfigurationError(AtlasException):
     """Configuração inválida ou inconsistente para execução."""
 
 
-@dataclass(frozen=True)
 class EngineExecutionError(AtlasException):
     """Erro inesperado durante execução do Engine (encapsulado)."""
@@ -43,13 +43,20 @@ clareza e rastreabilidade na execução de pipelines.
 
 from __future__ import annotations
 
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List
-from datetime import timezone
+from datetime import datetime, timezone
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional
 
 
-@dataclass
+# "Now provider" do hot path de log: referências diretas evitam lookups de
+# atributo a cada evento.
+_now = datetime.now
+_UTC = timezone.utc
+
+
+@dataclass(slots=True)
 class RunContext:
     """
     Contexto de execução compartilhado de uma run do pipeline.
@@ -78,6 +85,10 @@ class RunContext:
         - Logs incluem sempre `run_id` e `step_id`
         - Warnings são associados explicitamente a um Step
 
+    Decisões de implementação:
+        - `slots=True`: sem `__dict__` por instância e acesso a atributos
+          via descritores de slot; atributos não declarados são rejeitados
+
     Limites explícitos:
         - Não executa Steps
         - Não decide políticas de execução
@@ -94,8 +105,17 @@ class RunContext:
     meta: Dict[str, Any] = field(default_factory=dict)
 
     _artifacts: Dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    # list (não deque): consumidores fatiam (`events[-n:]`) e serializam com `json`
     events: List[Dict[str, Any]] = field(default_factory=list, init=False)
-    warnings: Dict[str, List[str]] = field(default_factory=dict, init=False)
+    # defaultdict: leitores devem usar `.get(step_id)` para não criar entradas vazias
+    warnings: DefaultDict[str, List[str]] = field(default_factory=lambda: defaultdict(list), init=False)
+
+    # Extensões opcionais lidas/escritas via getattr/setattr por Steps e Engine.
+    # Com `slots=True` atributos ad-hoc não são aceitos; por isso são declarados.
+    dataset: Any = field(default=None, init=False, repr=False)
+    impacts: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    manifest: Any = field(default=None, init=False, repr=False)
+    store: Any = field(default=None, init=False, repr=False)
 
     # -----------------------------
     # Artifact store
@@ -107,25 +127,32 @@ class RunContext:
         return key in self._artifacts
 
     def get_artifact(self, key: str) -> Any:
-        if key not in self._artifacts:
-            raise KeyError(key)
+        # Um único lookup: o próprio dict levanta KeyError(key) se ausente
         return self._artifacts[key]
 
     # -----------------------------
     # Logging & warnings
     # -----------------------------
     def log(self, *, step_id: str, level: str, message: str, **extra: Any) -> None:
-        event = {
+        self.events.append({
             "run_id": self.run_id,
-            "step_id": step_id,
+            "step_id": sys.intern(step_id) if type(step_id) is str else step_id,
             "level": level,
             "message": message,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-        event.update(extra)
-        self.events.append(event)
+            "timestamp": _now(_UTC).isoformat(),
+            **extra,
+        })
 
     def add_warning(self, *, step_id: str, message: str) -> None:
-        if step_id not in self.warnings:
-            self.warnings[step_id] = []
-        self.warnings[step_id].append(message)
+        self.warnings[sys.intern(step_id) if type(step_id) is str else step_id].append(message)
+
+    def add_warnings(self, *, step_id: str, messages: Iterable[str]) -> None:
+        """Registra vários warnings de um Step em uma única operação.
+
+        Equivalente a chamar `add_warning` para cada mensagem, preservando
+        a ordem; uma coleção vazia não cria entrada para o Step.
+        """
+        messages = list(messages)
+        if not messages:
+            return
+        self.warnings[sys.intern(step_id) if type(step_id) is str else step_id].extend(messages)
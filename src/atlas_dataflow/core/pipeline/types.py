@@ -22,7 +22,7 @@ Princípios fundamentais:
 
 Invariantes:
     - Enums possuem valores textuais canônicos
-    - StepResult é imutável e seguro contra mutação acidental
+    - StepResult é imutável por contrato (nunca mutado após criado)
     - Tipos não dependem de engine, pipeline ou UI
 
 Limites explícitos:
@@ -37,9 +37,23 @@ interoperabilidade e clareza semântica no pipeline.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, Sequence
+
+
+# Dataclass "congelada por convenção": `slots=True` elimina o `__dict__` por
+# instância e evita o `object.__setattr__` por campo que `frozen=True` impõe
+# no `__init__`. A imutabilidade passa a ser contrato documentado, não
+# verificação em runtime.
+fast_frozen_dataclass = partial(dataclass, slots=True)
+
+# Sentinela compartilhada para `StepResult.warnings`: a maioria dos Steps não
+# emite warnings, e uma tupla vazia (imutável e serializável em JSON) evita
+# alocar uma lista nova por resultado.
+_EMPTY_WARNINGS: tuple = ()
 
 
 class StepKind(str, Enum):
@@ -126,7 +140,7 @@ class StepStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass
 class StepResult:
     """
     Resultado imutável da execução de um Step.
@@ -136,7 +150,7 @@ class StepResult:
     artefatos produzidos.
 
     O `StepResult` é projetado para ser:
-        - imutável (frozen)
+        - imutável por convenção (não deve ser alterado após criado)
         - serializável
         - independente de engine e UI
         - adequado para auditoria e inspeção posterior
@@ -152,8 +166,13 @@ class StepResult:
         - payload: dados adicionais livres associados ao resultado
 
     Decisões arquiteturais:
-        - A imutabilidade garante segurança contra mutações acidentais
+        - A imutabilidade é um contrato: enriquecimentos criam uma nova
+          instância via `dataclasses.replace` (ver Engine)
+        - Implementado com `slots=True` em vez de `frozen=True` para reduzir
+          o custo de construção, que ocorre a cada execução de Step
         - Métricas, warnings e artifacts possuem defaults explícitos
+        - `warnings` usa uma tupla vazia compartilhada como default; quem
+          precisar acrescentar mensagens deve copiar (`list(result.warnings)`)
         - O resultado não contém lógica de execução
 
     Invariantes:
@@ -175,6 +194,40 @@ class StepResult:
     status: StepStatus
     summary: str
     metrics: Dict[str, Any] = field(default_factory=dict)
-    warnings: List[str] = field(default_factory=list)
+    warnings: Sequence[str] = _EMPTY_WARNINGS
     artifacts: Dict[str, str] = field(default_factory=dict)
     payload: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # step_id se repete em eventos, warnings e Manifest: internar permite
+        # comparação por identidade nos lookups de dict.
+        if type(self.step_id) is str:
+            self.step_id = sys.intern(self.step_id)
+
+    @classmethod
+    def ok(
+        cls,
+        *,
+        step_id: str,
+        kind: StepKind,
+        status: StepStatus,
+        summary: str,
+    ) -> "StepResult":
+        """
+        Construção especializada para resultados sem métricas, warnings,
+        artifacts ou payload.
+
+        Equivalente a `StepResult(step_id=..., kind=..., status=..., summary=...)`,
+        mas atribui os slots diretamente, sem passar pelo `__init__` genérico
+        (resolução de defaults e `default_factory`).
+        """
+        obj = cls.__new__(cls)
+        obj.step_id = sys.intern(step_id) if type(step_id) is str else step_id
+        obj.kind = kind
+        obj.status = status
+        obj.summary = summary
+        obj.metrics = {}
+        obj.warnings = _EMPTY_WARNINGS
+        obj.artifacts = {}
+        obj.payload = {}
+        return obj
@@ -26,9 +26,11 @@ Fonte de verdade (canônico):
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Union, overload
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union, overload
 
-from atlas_dataflow.core.pipeline.context import RunContext as _CanonicalRunContext
+if TYPE_CHECKING:  # import real adiado para o primeiro uso (ver `_canonical`)
+    from atlas_dataflow.core.pipeline.context import RunContext as _CanonicalRunContext
 
 
 # ---------------------------------------------------------------------------
@@ -37,6 +39,63 @@ from atlas_dataflow.core.pipeline.context import RunContext as _CanonicalRunCont
 
 CreatedAt = Union[datetime, str, None]
 
+# Referências ligadas no import (evitam LOAD_ATTR por chamada)
+_FROMISO = datetime.fromisoformat
+_NOW = datetime.now
+_UTC = timezone.utc
+
+# Tokens aceitos como "agora" em `created_at` textual (compat legado).
+_NOW_TOKENS = frozenset({"now", "utcnow", "NOW", "UTCNOW", "Now", "UtcNow"})
+
+
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime:
+    """Parse ISO (com cache) garantindo timezone UTC quando ausente.
+
+    `datetime` é imutável e hashable, portanto seguro para cache; entradas
+    inválidas propagam a exceção e não são memorizadas.
+    """
+    dt = _FROMISO(value)
+    return dt if dt.tzinfo else dt.replace(tzinfo=_UTC)
+
+
+def _utc_now(_: Any = None) -> datetime:
+    return _NOW(_UTC)
+
+
+def _from_datetime(created_at: datetime) -> datetime:
+    # Garante timezone (UTC) por segurança
+    return created_at if created_at.tzinfo else created_at.replace(tzinfo=_UTC)
+
+
+def _from_str(created_at: str) -> datetime:
+    # Fast path: tokens canônicos sem alocar cópia normalizada
+    if len(created_at) <= 6 and created_at in _NOW_TOKENS:
+        return _NOW(_UTC)
+    try:
+        return _parse_iso(created_at)
+    except ValueError:
+        # Compat pragmática: em testes antigos, `created_at` era texto livre.
+        return _NOW(_UTC)
+
+
+def _from_other(created_at: Any) -> datetime:
+    # Subclasses (ex.: pandas.Timestamp) não casam no lookup exato por tipo
+    if isinstance(created_at, datetime):
+        return _from_datetime(created_at)
+    if isinstance(created_at, str):
+        return _from_str(created_at)
+    # Fallback defensivo
+    return _utc_now()
+
+
+# Dispatch por tipo exato: um lookup de dict em vez de uma cadeia de isinstance
+_CREATED_AT_HANDLERS = {
+    type(None): _utc_now,
+    datetime: _from_datetime,
+    str: _from_str,
+}
+
 
 def _normalize_created_at(created_at: CreatedAt) -> datetime:
     """Normaliza `created_at` (compat).
@@ -45,22 +104,24 @@ def _normalize_created_at(created_at: CreatedAt) -> datetime:
     - str: tenta parse ISO; aceita valores como "now"
     - None: usa now() UTC
     """
-    if created_at is None:
-        return datetime.now(timezone.utc)
-    if isinstance(created_at, datetime):
-        # Garante timezone (UTC) por segurança
-        return created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc)
-    if isinstance(created_at, str):
-        if created_at.strip().lower() in {"now", "utcnow"}:
-            return datetime.now(timezone.utc)
-        try:
-            dt = datetime.fromisoformat(created_at)
-            return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
-        except Exception:
-            # Compat pragmática: em testes antigos, `created_at` era texto livre.
-            return datetime.now(timezone.utc)
-    # Fallback defensivo
-    return datetime.now(timezone.utc)
+    return _CREATED_AT_HANDLERS.get(type(created_at), _from_other)(created_at)
+
+
+# ---------------------------------------------------------------------------
+# Resolução lazy da classe canônica
+# ---------------------------------------------------------------------------
+
+_canonical_cls: Optional[type] = None
+
+
+def _canonical() -> type:
+    """Importa (uma vez) e retorna o RunContext canônico do pipeline."""
+    global _canonical_cls
+    if _canonical_cls is None:
+        from atlas_dataflow.core.pipeline.context import RunContext as cls
+
+        _canonical_cls = cls
+    return _canonical_cls
 
 
 # ---------------------------------------------------------------------------
@@ -96,8 +157,24 @@ def RunContext(  # noqa: N802  (compat mantém nome público)
 
     Observação:
     - `**_` ignora kwargs legados que não fazem mais parte do contrato público.
+    - Fast path: com `created_at` já tz-aware e config/contract presentes,
+      nenhuma normalização é necessária e o construtor canônico é chamado direto.
     """
-    return _CanonicalRunContext(
+    canonical = _canonical()
+    if (
+        isinstance(created_at, datetime)
+        and created_at.tzinfo is not None
+        and config is not None
+        and contract is not None
+    ):
+        return canonical(
+            run_id=run_id,
+            created_at=created_at,
+            config=config,
+            contract=contract,
+            meta=meta or {},
+        )
+    return canonical(
         run_id=run_id,
         created_at=_normalize_created_at(created_at),
         config=config or {},
@@ -106,8 +183,11 @@ def RunContext(  # noqa: N802  (compat mantém nome público)
     )
 
 
-# Para quem precisar do tipo/classe canônica (typing, isinstance, etc.)
-RunContextClass = _CanonicalRunContext
+def __getattr__(name: str) -> Any:
+    """PEP 562: `RunContextClass` (tipo canônico, p/ typing/isinstance) é resolvido sob demanda."""
+    if name == "RunContextClass":
+        return _canonical()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
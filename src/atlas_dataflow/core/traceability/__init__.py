@@ -21,6 +21,7 @@ API pública exposta:
     - step_failed       → registra falha de um Step
     - save_manifest     → persistência do Manifest em JSON
     - load_manifest     → restauração determinística do Manifest
+    - dumps_deterministic_json → JSON canônico (chaves ordenadas) do Manifest
 
 Decisões arquiteturais:
     - Nenhum evento é emitido implicitamente
@@ -42,24 +43,69 @@ Este pacote existe para garantir rastreabilidade forense,
 auditoria confiável e reprodutibilidade das execuções.
 """
 
-from .manifest import (
-    AtlasManifest,
-    create_manifest,
-    add_event,
-    step_started,
-    step_finished,
-    step_failed,
-    save_manifest,
-    load_manifest,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .manifest import (
+        AtlasManifest,
+        create_manifest,
+        add_event,
+        add_events,
+        step_started,
+        step_finished,
+        step_failed,
+        save_manifest,
+        save_manifest_async,
+        AsyncManifestWriter,
+        load_manifest,
+        save_manifest_split,
+        load_manifest_split,
+        dumps_deterministic_json,
+    )
+
+# Re-exports resolvidos sob demanda (PEP 562): importar o pacote como
+# namespace não carrega `manifest.py` até que um nome seja acessado.
+_LAZY = frozenset({
+    "AtlasManifest",
+    "create_manifest",
+    "add_event",
+    "add_events",
+    "step_started",
+    "step_finished",
+    "step_failed",
+    "save_manifest",
+    "save_manifest_async",
+    "AsyncManifestWriter",
+    "load_manifest",
+    "save_manifest_split",
+    "load_manifest_split",
+    "dumps_deterministic_json",
+})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        from . import manifest
+
+        value = getattr(manifest, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "AtlasManifest",
     "create_manifest",
     "add_event",
+    "add_events",
     "step_started",
     "step_finished",
     "step_failed",
     "save_manifest",
+    "save_manifest_async",
+    "AsyncManifestWriter",
     "load_manifest",
+    "save_manifest_split",
+    "load_manifest_split",
+    "dumps_deterministic_json",
 ]
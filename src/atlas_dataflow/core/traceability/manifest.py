@@ -48,11 +48,35 @@ auditoria confiável e reprodutibilidade das execuções.
 
 from __future__ import annotations
 
+import atexit
+import gzip
 import json
+import os
+import threading
+import time
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Union, Tuple
+
+try:
+    # orjson é opcional: quando disponível, acelera save/load do Manifest
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    # ciso8601 é opcional: parse ISO 8601 em C (fallback: datetime.fromisoformat)
+    from ciso8601 import parse_datetime as _fromiso  # type: ignore
+except Exception:  # pragma: no cover
+    _fromiso = datetime.fromisoformat
+
+try:
+    # zstandard é opcional: compressão `.zst` de Manifests grandes
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover
+    zstandard = None  # type: ignore
 
 try:
     # StepResult é o tipo canônico produzido pelo Engine (core/pipeline)
@@ -91,7 +115,11 @@ def _ensure_tzaware_utc(dt: datetime) -> datetime:
     Returns:
         datetime: Timestamp timezone-aware normalizado para UTC.
     """
-    if dt.tzinfo is None:
+    tz = dt.tzinfo
+    if tz is timezone.utc:
+        # Já canônico: evita `astimezone` (e a cópia que ele produz)
+        return dt
+    if tz is None:
         return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
@@ -125,7 +153,27 @@ def _iso(dt: datetime) -> str:
     Returns:
         str: Representação ISO 8601 do timestamp em UTC.
     """
-    return _ensure_tzaware_utc(dt).isoformat()
+    return _iso_cached(_ensure_tzaware_utc(dt))
+
+
+@lru_cache(maxsize=2048)
+def _iso_cached(dt: datetime) -> str:
+    """`isoformat` memorizado para datetimes já normalizados em UTC.
+
+    `datetime` é imutável e hashable; eventos que compartilham o mesmo
+    instante (ex.: lote de Steps com o mesmo `ts`) reutilizam a string.
+    """
+    return dt.isoformat()
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse ISO 8601 memorizado (strings produzidas por `_iso`).
+
+    Usa `ciso8601` quando instalado. Entradas inválidas propagam a
+    exceção (`ValueError`) e não são memorizadas.
+    """
+    return _fromiso(value)
 
 
 def _ms_between(start: datetime, end: datetime) -> int:
@@ -141,7 +189,7 @@ def _ms_between(start: datetime, end: datetime) -> int:
 
     Decisões arquiteturais:
         - Ambos os timestamps são normalizados para UTC
-        - A duração é expressa em milissegundos inteiros
+        - A duração é expressa em milissegundos inteiros (truncados)
         - Valores negativos são truncados para zero
 
     Invariantes:
@@ -161,12 +209,13 @@ def _ms_between(start: datetime, end: datetime) -> int:
     Returns:
         int: Duração em milissegundos entre `start` e `end`.
     """
-    s = _ensure_tzaware_utc(start)
-    e = _ensure_tzaware_utc(end)
-    return max(0, int((e - s).total_seconds() * 1000))
+    td = _ensure_tzaware_utc(end) - _ensure_tzaware_utc(start)
+    # Aritmética inteira sobre os componentes do timedelta (sem float)
+    ms = td.days * 86_400_000 + td.seconds * 1000 + td.microseconds // 1000
+    return ms if ms > 0 else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AtlasManifest:
     """
     Manifest v1 — registro forense de uma execução de pipeline.
@@ -192,6 +241,8 @@ class AtlasManifest:
         - Steps e eventos são atualizados apenas por chamadas explícitas da API
         - A estrutura é compatível com persistência em JSON
         - O schema é mínimo e orientado a rastreabilidade
+        - `slots=True`: sem `__dict__` por instância; atributos não
+          declarados são rejeitados
 
     Invariantes:
         - `steps` é sempre um dicionário indexado por step_id
@@ -210,38 +261,103 @@ class AtlasManifest:
     steps: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     events: List[Dict[str, Any]] = field(default_factory=list)
 
-    def to_dict(self) -> Dict[str, Any]:
+    # Cache em memória (não serializado) de `started_at` como datetime,
+    # evitando reparsear a string ISO em `step_finished`.
+    _started_dt: Dict[str, datetime] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Event Log segmentado (opcional): com `events_sink` definido, sempre que
+    # `events` atinge `flush_threshold` os eventos são anexados ao sink em
+    # JSON-Lines e apenas a cauda permanece em memória. Snapshots passam a
+    # custar O(cauda) em vez de O(eventos da run).
+    events_sink: Optional[Path] = field(default=None, repr=False, compare=False)
+    flush_threshold: int = field(default=1024, repr=False, compare=False)
+    _events_flushed: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Persistência dividida (`save_manifest_split`): eventos já anexados a
+    # `events.jsonl`, por diretório de destino.
+    _split_written: Dict[Path, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Throttling de `save_manifest(min_interval=...)`: último save por caminho
+    # (relógio monotônico).
+    _last_saved: Dict[Path, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _events_segment(self) -> Optional[Dict[str, Any]]:
+        """Referência ao segmento JSON-Lines já descarregado (se houver)."""
+        if self.events_sink is None or not self._events_flushed:
+            return None
+        return {"path": str(self.events_sink), "count": self._events_flushed}
+
+    def to_dict(self, copy: bool = True) -> Dict[str, Any]:
         """
         Converte o Manifest para sua representação em dicionário.
 
-        Esta função produz uma cópia profunda e serializável da estrutura
-        do Manifest, adequada para persistência em JSON ou inspeção externa.
+        Esta função produz uma cópia serializável da estrutura do Manifest
+        (containers de `run`, `inputs`, cada Step e cada evento), adequada
+        para persistência em JSON ou inspeção externa.
 
         Decisões arquiteturais:
             - Retorna apenas tipos serializáveis
-            - Evita vazamento de referências internas
+            - Evita vazamento de referências internas (padrão)
             - Preserva exatamente o conteúdo semântico do Manifest
+            - `copy=False` devolve a visão sem cópias (`_to_serializable_view`)
+              para consumidores somente-leitura imediatos (ex.: encoders)
 
         Invariantes:
-            - O dicionário retornado é independente do estado interno
-            - Alterações no retorno não afetam o Manifest em memória
+            - Com `copy=True`, o dicionário retornado é independente do estado interno
+            - Com `copy=True`, alterações no retorno não afetam o Manifest em memória
 
         Limites explícitos:
             - Não valida conteúdo
             - Não aplica normalização ou migração de schema
 
+        Args:
+            copy (bool): Copia os containers (padrão) ou compartilha os internos.
+
         Returns:
             Dict[str, Any]: Representação serializável do Manifest.
         """
-        return {
+        if not copy:
+            return self._to_serializable_view()
+        data = {
             "run": dict(self.run),
             "inputs": dict(self.inputs),
             "steps": {k: dict(v) for k, v in self.steps.items()},
             "events": [dict(e) for e in self.events],
         }
+        segment = self._events_segment()
+        if segment is not None:
+            data["events_segment"] = segment
+        return data
+
+    def _to_serializable_view(self) -> Dict[str, Any]:
+        """
+        Visão serializável do Manifest **sem cópias** (uso interno).
+
+        Diferente de `to_dict`, compartilha as estruturas internas; existe
+        para o caminho de persistência, onde o resultado é consumido apenas
+        para leitura pelo encoder JSON e descartado em seguida.
+
+        Invariantes:
+            - A visão nunca deve ser mutada pelo chamador
+        """
+        data = {
+            "run": self.run,
+            "inputs": self.inputs,
+            "steps": self.steps,
+            "events": self.events,
+        }
+        segment = self._events_segment()
+        if segment is not None:
+            data["events_segment"] = segment
+        return data
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "AtlasManifest":
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        copy: bool = True,
+        base_dir: Optional[Path] = None,
+    ) -> "AtlasManifest":
         """
         Reconstrói um Manifest a partir de sua representação em dicionário.
 
@@ -253,6 +369,12 @@ class AtlasManifest:
             - Campos ausentes são inicializados com valores vazios
             - A reconstrução é permissiva e estrutural
             - Não há validação semântica implícita
+            - Havendo `events_segment`, os eventos descarregados em JSON-Lines
+              são lidos e antepostos à cauda (Event Log completo em memória);
+              um `path` relativo é resolvido a partir de `base_dir` (o
+              diretório do manifest.json em `load_manifest`)
+            - `copy=False` adota os containers de `data` sem copiá-los (uso
+              em dados recém-desserializados, como em `load_manifest`)
 
         Invariantes:
             - O Manifest reconstruído é funcionalmente equivalente ao original
@@ -265,16 +387,28 @@ class AtlasManifest:
 
         Args:
             data (Dict[str, Any]): Dicionário serializado do Manifest.
+            copy (bool): Copia os containers de `data` (padrão) ou os adota.
+            base_dir (Optional[Path]): Base para `events_segment.path` relativo.
 
         Returns:
             AtlasManifest: Nova instância reconstruída a partir do dicionário.
         """
-        return cls(
-            run=dict(data.get("run", {})),
-            inputs=dict(data.get("inputs", {})),
-            steps={k: dict(v) for k, v in (data.get("steps", {}) or {}).items()},
-            events=[dict(e) for e in (data.get("events", []) or [])],
-        )
+        run = data.get("run") or {}
+        inputs = data.get("inputs") or {}
+        steps = data.get("steps") or {}
+        events = data.get("events") or []
+        if copy:
+            run = dict(run)
+            inputs = dict(inputs)
+            steps = {k: dict(v) for k, v in steps.items()}
+            events = [dict(e) for e in events]
+        segment = data.get("events_segment")
+        if segment:
+            seg_path = Path(segment["path"])
+            if base_dir is not None and not seg_path.is_absolute():
+                seg_path = Path(base_dir) / seg_path
+            events = _read_events_segment(seg_path, int(segment["count"])) + events
+        return cls(run=run, inputs=inputs, steps=steps, events=events)
 
 
 def create_manifest(
@@ -284,6 +418,8 @@ def create_manifest(
     atlas_version: str,
     config_hash: str,
     contract_hash: str,
+    events_sink: Optional[Path] = None,
+    flush_threshold: int = 1024,
 ) -> AtlasManifest:
     """
     Cria o Manifest inicial de uma execução (Manifest v1).
@@ -320,6 +456,10 @@ def create_manifest(
         atlas_version (str): Versão do Atlas DataFlow utilizada.
         config_hash (str): Hash semântico da configuração resolvida.
         contract_hash (str): Hash semântico do contrato utilizado.
+        events_sink (Optional[Path]): Arquivo JSON-Lines para descarregar o
+            Event Log em segmentos (opcional; padrão: tudo em memória).
+        flush_threshold (int): Número de eventos em memória que dispara o
+            descarregamento para `events_sink`.
 
     Returns:
         AtlasManifest: Instância inicializada do Manifest v1.
@@ -338,6 +478,8 @@ def create_manifest(
         },
         steps={},
         events=[],
+        events_sink=events_sink,
+        flush_threshold=flush_threshold,
     )
 
 
@@ -348,6 +490,7 @@ def add_event(
     ts: datetime,
     step_id: Optional[str] = None,
     payload: Optional[Dict[str, Any]] = None,
+    ts_iso: Optional[str] = None,
 ) -> None:
     """
     Adiciona um evento explícito ao Event Log do Manifest.
@@ -383,47 +526,141 @@ def add_event(
         ts (datetime): Timestamp do evento.
         step_id (Optional[str]): Identificador do Step associado, se aplicável.
         payload (Optional[Dict[str, Any]]): Dados adicionais associados ao evento.
+        ts_iso (Optional[str]): `ts` já formatado via `_iso`, quando o chamador
+            já o calculou (evita normalizar/formatar o mesmo instante duas vezes).
 
     Returns:
         None
     """
-    ts = _ensure_tzaware_utc(ts)
-    m = manifest if isinstance(manifest, AtlasManifest) else AtlasManifest.from_dict(manifest)
+    ev = _build_event(event_type, ts, step_id, payload, ts_iso)
+
+    # Despacho único por tipo: AtlasManifest segue o caminho tipado
+    if isinstance(manifest, AtlasManifest):
+        _append_events(manifest, (ev,))
+    else:
+        _steps_and_events(manifest)[1].append(ev)
 
-    ev: Dict[str, Any] = {"event_type": event_type, "timestamp": _iso(ts)}
+
+def _append_events(manifest: AtlasManifest, evs: Iterable[Dict[str, Any]]) -> None:
+    """Caminho tipado (AtlasManifest): anexa eventos e aplica o flush do sink."""
+    events = manifest.events
+    events.extend(evs)
+    if manifest.events_sink is not None and len(events) >= manifest.flush_threshold:
+        _flush_events(manifest)
+
+
+def _build_event(
+    event_type: str,
+    ts: datetime,
+    step_id: Optional[str] = None,
+    payload: Optional[Dict[str, Any]] = None,
+    ts_iso: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Monta um evento no formato canônico do Event Log (`add_event`/`add_events`)."""
+    if ts_iso is None:
+        ts_iso = _iso(ts)
+    ev: Dict[str, Any] = {"event_type": event_type, "timestamp": ts_iso}
     if step_id is not None:
         ev["step_id"] = step_id
     if payload is not None:
         ev["payload"] = payload
+    return ev
 
-    m.events.append(ev)
 
-    if not isinstance(manifest, AtlasManifest):
-        manifest.clear()
-        manifest.update(m.to_dict())
+def add_events(
+    manifest: Union[AtlasManifest, Dict[str, Any]],
+    events: Iterable[Dict[str, Any]],
+) -> None:
+    """
+    Adiciona vários eventos ao Event Log em uma única operação.
+
+    Equivale a chamar `add_event` para cada item, na ordem fornecida; cada
+    item é um dict com as chaves `event_type`, `ts` e, opcionalmente,
+    `step_id` e `payload`. Os eventos são montados antes e anexados com um
+    único `extend`.
 
+    Invariantes:
+        - A ordem dos itens é preservada no Event Log
+        - O formato de cada evento é idêntico ao produzido por `add_event`
 
-def _get_manifest(manifest: Union[AtlasManifest, Dict[str, Any]]) -> Tuple[AtlasManifest, bool]:
+    Raises:
+        KeyError: Se algum item não possuir `event_type` ou `ts`.
     """
-    Normaliza a entrada do Manifest para uma instância de `AtlasManifest`.
+    built = [
+        _build_event(e["event_type"], e["ts"], e.get("step_id"), e.get("payload"))
+        for e in events
+    ]
+    if not built:
+        return
+    if isinstance(manifest, AtlasManifest):
+        _append_events(manifest, built)
+    else:
+        _steps_and_events(manifest)[1].extend(built)
+
+
+def _encode_event_line(ev: Dict[str, Any]) -> bytes:
+    """Serializa um evento como uma linha JSON-Lines (chaves ordenadas, compacta)."""
+    return dumps_deterministic_json(ev, pretty=False) + b"\n"
+
+
+def _flush_events(manifest: AtlasManifest) -> None:
+    """
+    Descarrega os eventos em memória para o segmento JSON-Lines do Manifest.
+
+    O primeiro descarregamento trunca o sink; os seguintes anexam, de modo
+    que o arquivo contém exatamente os eventos descarregados, em ordem (FIFO).
+    """
+    sink = Path(manifest.events_sink)  # type: ignore[arg-type]
+    sink.parent.mkdir(parents=True, exist_ok=True)
+    with sink.open("ab" if manifest._events_flushed else "wb") as fh:
+        fh.write(b"".join(_encode_event_line(ev) for ev in manifest.events))
+    manifest._events_flushed += len(manifest.events)
+    manifest.events.clear()
 
-    Esta função interna aceita tanto uma instância de `AtlasManifest`
-    quanto sua representação em dicionário, retornando sempre uma
-    instância canônica de `AtlasManifest` para uso interno.
 
-    O valor booleano retornado indica se a entrada original era um
-    dicionário, permitindo que o chamador sincronize as alterações
-    de volta para o objeto original quando necessário.
+def _segment_relative_to(data: Dict[str, Any], manifest_path: Path) -> Dict[str, Any]:
+    """Reescreve `events_segment.path` relativo ao diretório do Manifest gravado.
+
+    Assim o par manifest.json + segmento JSON-Lines pode ser movido/copiado
+    junto para outro diretório. Sem caminho relativo possível (ex.: drives
+    distintos no Windows) o caminho absoluto é mantido.
+    """
+    segment = data.get("events_segment")
+    if not segment:
+        return data
+    sink = os.path.abspath(segment["path"])
+    try:
+        rel = Path(os.path.relpath(sink, os.path.abspath(manifest_path.parent))).as_posix()
+    except ValueError:  # pragma: no cover
+        rel = sink
+    return {**data, "events_segment": {**segment, "path": rel}}
+
+
+def _read_events_segment(path: Path, count: int) -> List[Dict[str, Any]]:
+    """Lê os `count` primeiros eventos de um segmento JSON-Lines."""
+    with path.open("rb") as fh:
+        return [_loads_json(line) for _, line in zip(range(count), fh)]
+
+
+def _steps_and_events(
+    manifest: Union[AtlasManifest, Dict[str, Any]],
+) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Resolve os containers mutáveis (`steps`, `events`) do Manifest.
+
+    Esta função interna aceita tanto uma instância de `AtlasManifest`
+    quanto sua representação em dicionário e retorna as próprias
+    estruturas internas, para que as mutações ocorram **in-place**.
 
     Decisões arquiteturais:
         - A API pública aceita Manifest como objeto ou dict
-        - A normalização ocorre de forma explícita e controlada
-        - A reconstrução do Manifest delega para `AtlasManifest.from_dict`
+        - Manifests dict são mutados diretamente, sem reconstrução via
+          `from_dict`/`to_dict` (custo O(1) por mutação, não O(eventos))
+        - Seções ausentes (ou None) no dict são criadas vazias
 
     Invariantes:
-        - O primeiro valor retornado é sempre um `AtlasManifest`
-        - O segundo valor indica corretamente se houve conversão a partir de dict
-        - Nenhuma mutação ocorre no objeto de entrada original neste ponto
+        - Os containers retornados pertencem ao Manifest de entrada
+        - `steps` é sempre um dict e `events` sempre uma lista
 
     Limites explícitos:
         - Não valida semântica do conteúdo do Manifest
@@ -435,13 +672,17 @@ def _get_manifest(manifest: Union[AtlasManifest, Dict[str, Any]]) -> Tuple[Atlas
             ou dicionário serializável.
 
     Returns:
-        Tuple[AtlasManifest, bool]: Tupla contendo:
-            - a instância normalizada de `AtlasManifest`
-            - flag indicando se a entrada original era um dicionário
+        Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]: `steps` e `events`.
     """
     if isinstance(manifest, AtlasManifest):
-        return manifest, False
-    return AtlasManifest.from_dict(manifest), True
+        return manifest.steps, manifest.events
+    steps = manifest.get("steps")
+    if steps is None:
+        steps = manifest["steps"] = {}
+    events = manifest.get("events")
+    if events is None:
+        events = manifest["events"] = []
+    return steps, events
 
 
 def step_started(
@@ -489,23 +730,19 @@ def step_started(
         None
     """
     ts = _ensure_tzaware_utc(ts)
-    m, is_dict = _get_manifest(manifest)
-
-    m.steps.setdefault(step_id, {})
-    m.steps[step_id].update(
-        {
-            "step_id": step_id,
-            "kind": kind,
-            "status": "running",
-            "started_at": _iso(ts),
-        }
-    )
-
-    add_event(m, event_type="step_started", ts=ts, step_id=step_id, payload={"kind": kind})
+    ts_iso = _iso_cached(ts)
+    steps, _ = _steps_and_events(manifest)
+
+    s = steps.get(step_id)
+    if s is None:
+        s = steps[step_id] = {"step_id": step_id}
+    s["kind"] = kind
+    s["status"] = "running"
+    s["started_at"] = ts_iso
+    if isinstance(manifest, AtlasManifest):
+        manifest._started_dt[step_id] = ts
 
-    if is_dict:
-        manifest.clear()
-        manifest.update(m.to_dict())
+    add_event(manifest, event_type="step_started", ts=ts, ts_iso=ts_iso, step_id=step_id, payload={"kind": kind})
 
 
 def _normalize_step_result(result: Union[Dict[str, Any], Any]) -> Dict[str, Any]:
@@ -576,44 +813,41 @@ def step_finished(
         None
     """
     ts = _ensure_tzaware_utc(ts)
-    m, is_dict = _get_manifest(manifest)
-
-    s = m.steps.setdefault(step_id, {"step_id": step_id})
-    started_iso = s.get("started_at")
-    if started_iso:
+    ts_iso = _iso_cached(ts)
+    steps, _ = _steps_and_events(manifest)
+
+    s = steps.get(step_id)
+    if s is None:
+        s = steps[step_id] = {"step_id": step_id}
+    started_dt = manifest._started_dt.pop(step_id, None) if isinstance(manifest, AtlasManifest) else None
+    if started_dt is None:
+        # Manifest restaurado (load/dict): só a string ISO está disponível
+        started_iso = s.get("started_at")
         try:
-            started_dt = datetime.fromisoformat(started_iso)
-        except Exception:
+            started_dt = _parse_iso(started_iso) if started_iso else ts
+        except (TypeError, ValueError):
             started_dt = ts
-    else:
-        started_dt = ts
 
     payload = _normalize_step_result(result)
     status = payload.get("status", "success")
-    s.update(
-        {
-            "status": status,
-            "finished_at": _iso(ts),
-            "duration_ms": _ms_between(started_dt, ts),
-            "summary": payload.get("summary"),
-            "metrics": payload.get("metrics", {}) or {},
-            "warnings": payload.get("warnings", []) or [],
-            "artifacts": payload.get("artifacts", {}) or {},
-        }
-    )
+    duration_ms = _ms_between(started_dt, ts)
+    s["status"] = status
+    s["finished_at"] = ts_iso
+    s["duration_ms"] = duration_ms
+    s["summary"] = payload.get("summary")
+    s["metrics"] = payload.get("metrics") or {}
+    s["warnings"] = payload.get("warnings") or []
+    s["artifacts"] = payload.get("artifacts") or {}
 
     add_event(
-        m,
+        manifest,
         event_type="step_finished",
         ts=ts,
+        ts_iso=ts_iso,
         step_id=step_id,
-        payload={"status": status, "duration_ms": s.get("duration_ms", 0)},
+        payload={"status": status, "duration_ms": duration_ms},
     )
 
-    if is_dict:
-        manifest.clear()
-        manifest.update(m.to_dict())
-
 
 def step_failed(
     manifest: Union[AtlasManifest, Dict[str, Any]],
@@ -660,25 +894,188 @@ def step_failed(
         None
     """
     ts = _ensure_tzaware_utc(ts)
-    m, is_dict = _get_manifest(manifest)
-
-    s = m.steps.setdefault(step_id, {"step_id": step_id})
-    s.update(
-        {
-            "status": "failed",
-            "finished_at": _iso(ts),
-            "error": error,
-        }
-    )
+    ts_iso = _iso_cached(ts)
+    steps, _ = _steps_and_events(manifest)
+
+    s = steps.get(step_id)
+    if s is None:
+        s = steps[step_id] = {"step_id": step_id}
+    s["status"] = "failed"
+    s["finished_at"] = ts_iso
+    s["error"] = error
+    if isinstance(manifest, AtlasManifest):
+        # Mesmo ciclo de vida de `step_finished`: o início em cache não sobrevive ao Step
+        manifest._started_dt.pop(step_id, None)
 
-    add_event(m, event_type="step_failed", ts=ts, step_id=step_id, payload={"error": error})
+    add_event(manifest, event_type="step_failed", ts=ts, ts_iso=ts_iso, step_id=step_id, payload={"error": error})
 
-    if is_dict:
-        manifest.clear()
-        manifest.update(m.to_dict())
 
+# Floats cujo `repr` não usa expoente: nessa faixa o orjson produz o mesmo
+# texto que `json` (fora dela, ex.: 1e16 → "1e16" vs "1e+16").
+_PLAIN_FLOAT_MIN = 1e-4
+_PLAIN_FLOAT_MAX = 1e16
 
-def save_manifest(manifest: Union[AtlasManifest, Dict[str, Any]], path: Path) -> None:
+
+def _orjson_compatible(data: Any) -> bool:
+    """Indica se `data` serializa com orjson exatamente como com `json`.
+
+    Percorre a estrutura uma vez e recusa tudo o que os dois encoders
+    escrevem de forma diferente: chaves não-str (ordenação/conversão),
+    NaN/Infinity (orjson escreve `null`), floats em notação exponencial
+    e tipos fora de dict/list/tuple/str/int/float/bool/None (floats numpy
+    float64 são subclasse de float e aceitos).
+    """
+    stack = [data]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    while stack:
+        v = pop()
+        t = type(v)
+        if t is str or t is int or t is bool or v is None:
+            continue
+        if t is dict:
+            for k in v:
+                if type(k) is not str:
+                    return False
+            extend(v.values())
+        elif t is list or t is tuple:
+            extend(v)
+        elif isinstance(v, float):
+            # NaN/inf falham a comparação e caem no `return False`
+            if not (v == 0.0 or _PLAIN_FLOAT_MIN <= abs(v) < _PLAIN_FLOAT_MAX):
+                return False
+        else:
+            return False
+    return True
+
+
+def _json_default(obj: Any) -> Any:
+    """`default` do `json`: converte escalares numpy no tipo Python equivalente."""
+    if type(obj).__module__ == "numpy" and hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_deterministic_json(data: Any, pretty: bool = True) -> bytes:
+    """JSON UTF-8 com chaves ordenadas; mesmos bytes com ou sem orjson.
+
+    Encoder canônico do Manifest, também usado por quem precisa do mesmo
+    texto fora dele (ex.: trechos de payload no report). `pretty=True`
+    indenta com 2 espaços; `pretty=False` emite JSON compacto.
+
+    O orjson só é usado quando `_orjson_compatible` garante saída idêntica
+    à do `json`; qualquer outro caso (ou erro do orjson, ex.: int > 64 bits)
+    usa a stdlib.
+    """
+    if orjson is not None and _orjson_compatible(data):
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except (orjson.JSONEncodeError, TypeError):
+            pass
+    if pretty:
+        text = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True, default=_json_default)
+    else:
+        text = json.dumps(
+            data, ensure_ascii=False, separators=(",", ":"), sort_keys=True, default=_json_default
+        )
+    return text.encode("utf-8")
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Desserializa JSON UTF-8 gravado por `dumps_deterministic_json`.
+
+    O orjson é tentado primeiro; documentos que só a stdlib aceita (ex.:
+    `NaN`/`Infinity`, gravados pelo fallback de `dumps_deterministic_json`) são relidos
+    com `json`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def _encode_manifest(data: Dict[str, Any], pretty: bool = True) -> bytes:
+    """Serializa o Manifest em JSON UTF-8 com chaves ordenadas.
+
+    `pretty=True` usa indentação 2 (padrão, legível); `pretty=False` emite
+    JSON compacto para consumo por máquina. Os bytes não dependem de o
+    `orjson` estar instalado (ver `dumps_deterministic_json`).
+    """
+    return dumps_deterministic_json(data, pretty)
+
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _compress_payload(path: Path, payload: bytes, compress: bool = False) -> bytes:
+    """Aplica a compressão indicada pelo sufixo de `path` (ou por `compress`).
+
+    - `.zst`: zstandard (nível 3; exige o pacote `zstandard`)
+    - `.gz`: gzip com `mtime=0` (saída determinística)
+    - `compress=True` com outro sufixo: zstandard se instalado, senão gzip
+    - caso contrário: JSON sem compressão
+    """
+    suffix = path.suffix
+    if suffix == ".zst" or (compress and suffix != ".gz" and zstandard is not None):
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to write .zst manifests")
+        return zstandard.ZstdCompressor(level=3).compress(payload)
+    if suffix == ".gz" or compress:
+        return gzip.compress(payload, mtime=0)
+    return payload
+
+
+def _decompress_payload(raw: bytes) -> bytes:
+    """Detecta a compressão pelos magic bytes (zstd/gzip); JSON puro passa direto."""
+    if raw[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .zst manifests")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    if raw[:2] == _GZIP_MAGIC:
+        return gzip.decompress(raw)
+    return raw
+
+
+def _write_atomic(path: Path, payload: bytes, fsync: bool = False) -> None:
+    """Grava `payload` em arquivo temporário irmão e o move para `path` (os.replace).
+
+    O nome temporário é único por processo e thread, de modo que gravações
+    concorrentes do mesmo `path` (ex.: `save_manifest` e a thread do
+    `AsyncManifestWriter`) nunca compartilham o arquivo temporário.
+
+    Com `fsync=True` o conteúdo é forçado ao disco antes da troca, de modo
+    que o arquivo final nunca aponte para dados ainda em cache do SO.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        if not fsync:
+            tmp.write_bytes(payload)
+        else:
+            with open(tmp, "wb", buffering=1 << 20) as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def save_manifest(
+    manifest: Union[AtlasManifest, Dict[str, Any]],
+    path: Path,
+    *,
+    compress: bool = False,
+    pretty: bool = True,
+    min_interval: float = 0.0,
+    force: bool = False,
+    durable: bool = False,
+) -> bool:
     """
     Persiste um Manifest em disco no formato JSON.
 
@@ -692,9 +1089,22 @@ def save_manifest(manifest: Union[AtlasManifest, Dict[str, Any]], path: Path) ->
 
     Decisões arquiteturais:
         - O formato de persistência é JSON
+        - `orjson` é usado quando disponível (fallback: `json` da stdlib)
         - A ordenação de chaves é estável (`sort_keys=True`)
-        - A escrita é legível (indentação) sem afetar o determinismo
+        - A escrita é legível (indentação) sem afetar o determinismo;
+          `pretty=False` emite JSON compacto (menos bytes, encode mais rápido)
         - Diretórios intermediários são criados automaticamente
+        - A escrita é atômica: bytes vão para um temporário irmão
+          (`<path>.<pid>.<thread>.tmp`) e o arquivo é
+          substituído via `os.replace` (sem arquivos parcialmente gravados)
+        - Compressão opcional: sufixo `.zst` (zstandard) ou `.gz` (gzip), ou
+          `compress=True`; `load_manifest` detecta o formato pelos magic bytes
+        - Checkpoints por Step podem ser limitados com `min_interval`: um
+          `AtlasManifest` salvo no mesmo caminho há menos de `min_interval`
+          segundos não é regravado (evita O(N²) bytes em runs longas); o save
+          final da run deve usar `force=True`
+        - `durable=True` aplica `fsync` antes do `os.replace` (custo alto;
+          recomendado apenas na finalização)
 
     Invariantes:
         - O conteúdo persistido reflete exatamente o estado do Manifest fornecido
@@ -709,19 +1119,161 @@ def save_manifest(manifest: Union[AtlasManifest, Dict[str, Any]], path: Path) ->
     Args:
         manifest (Union[AtlasManifest, Dict[str, Any]]): Manifest a ser persistido.
         path (Path): Caminho do arquivo JSON de destino.
+        compress (bool): Comprime o JSON mesmo sem sufixo `.zst`/`.gz`.
+        pretty (bool): Indentação 2 (padrão) ou JSON compacto (`False`).
+        min_interval (float): Intervalo mínimo (s) entre saves do mesmo
+            `AtlasManifest` no mesmo caminho; `0` desativa o throttling.
+        force (bool): Ignora `min_interval` (checkpoint explícito/finalização).
+        durable (bool): Sincroniza o arquivo com o disco (`fsync`) antes da troca.
 
     Returns:
-        None
+        bool: `True` se o arquivo foi gravado, `False` se o save foi pulado
+        pelo throttling.
 
     Raises:
         OSError: Em caso de falha ao criar diretórios ou escrever o arquivo.
+        RuntimeError: Se `.zst` for solicitado sem o pacote `zstandard`.
         TypeError: Se o conteúdo do Manifest não for serializável em JSON.
     """
-    data = manifest.to_dict() if isinstance(manifest, AtlasManifest) else manifest
+    is_obj = isinstance(manifest, AtlasManifest)
+    if is_obj and min_interval > 0 and not force:
+        last = manifest._last_saved.get(path)
+        if last is not None and time.monotonic() - last < min_interval:
+            return False
+    data = _segment_relative_to(manifest._to_serializable_view() if is_obj else manifest, path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+    _write_atomic(path, _compress_payload(path, _encode_manifest(data, pretty), compress), fsync=durable)
+    if is_obj:
+        manifest._last_saved[path] = time.monotonic()
+    return True
 
 
+class AsyncManifestWriter:
+    """
+    Persistência de Manifests em background (thread dedicada).
+
+    O chamador apenas tira um snapshot e o registra como pendente; serialização
+    JSON e I/O acontecem na thread escritora, fora do caminho quente do pipeline.
+
+    Decisões arquiteturais:
+        - Um único snapshot pendente por `path`: um novo `submit` para o mesmo
+          `path` substitui o anterior ainda não gravado (`dropped` é
+          incrementado); snapshots de outros paths nunca são descartados
+        - No máximo `maxsize` paths distintos pendentes: acima disso `submit`
+          bloqueia até a thread escritora liberar espaço
+        - Escrita atômica (arquivo temporário + `os.replace`)
+
+    Invariantes:
+        - O snapshot é tirado no thread do chamador via `to_dict()` (cópia
+          dos containers), pois o Manifest segue sendo mutado pelo pipeline
+        - Após `flush()`, o snapshot mais recente de cada path foi gravado
+        - Estado compartilhado (`_pending`, `dropped`) só muda sob `_cond`
+
+    Limites explícitos:
+        - Snapshots intermediários do mesmo path podem não ser gravados
+        - Erros de escrita não interrompem a thread; o último é exposto em
+          `last_error` e relançado por `close()`
+    """
+
+    def __init__(self, maxsize: int = 8) -> None:
+        self._maxsize = max(1, maxsize)
+        self._pending: Dict[Path, Dict[str, Any]] = {}
+        self._writing = False
+        self._cond = threading.Condition()
+        self._closed = False
+        self.dropped = 0
+        self.last_error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="atlas-manifest-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, manifest: Union[AtlasManifest, Dict[str, Any]], path: Path) -> None:
+        """Registra um snapshot do Manifest para gravação em `path`."""
+        if self._closed:
+            raise RuntimeError("AsyncManifestWriter is closed")
+        if isinstance(manifest, AtlasManifest):
+            data = manifest.to_dict()
+        else:
+            data = dict(manifest)
+            data["steps"] = {k: dict(v) for k, v in (data.get("steps") or {}).items()}
+            data["events"] = list(data.get("events") or [])
+        path = Path(path)
+        data = _segment_relative_to(data, path)
+        with self._cond:
+            while path not in self._pending and len(self._pending) >= self._maxsize:
+                self._cond.wait()
+            if self._closed:
+                raise RuntimeError("AsyncManifestWriter is closed")
+            if path in self._pending:
+                self.dropped += 1
+            self._pending[path] = data
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Bloqueia até que todos os snapshots pendentes sejam gravados."""
+        with self._cond:
+            while self._pending or self._writing:
+                self._cond.wait()
+
+    def close(self) -> None:
+        """Grava pendências, encerra a thread e relança o último erro (se houver)."""
+        if not self._closed:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+            self._thread.join()
+        if self.last_error is not None:
+            raise self.last_error
+
+    def _run(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while not self._pending and not self._closed:
+                    cond.wait()
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, {}
+                self._writing = True
+                cond.notify_all()
+
+            try:
+                for path, data in batch.items():
+                    try:
+                        path.parent.mkdir(parents=True, exist_ok=True)
+                        _write_atomic(path, _compress_payload(path, _encode_manifest(data)))
+                    except Exception as exc:  # noqa: BLE001
+                        self.last_error = exc
+            finally:
+                with cond:
+                    self._writing = False
+                    cond.notify_all()
+
+
+_default_writer: Optional[AsyncManifestWriter] = None
+_default_writer_lock = threading.Lock()
+
+
+def _shutdown_default_writer() -> None:
+    if _default_writer is not None:
+        _default_writer.flush()
+
+
+def save_manifest_async(manifest: Union[AtlasManifest, Dict[str, Any]], path: Path) -> None:
+    """
+    Versão não bloqueante de `save_manifest` (checkpoints durante a run).
+
+    Enfileira um snapshot no `AsyncManifestWriter` padrão do processo,
+    criado sob demanda; pendências são gravadas no encerramento do
+    interpretador. O formato em disco é idêntico ao de `save_manifest`.
+    """
+    global _default_writer
+    if _default_writer is None:
+        with _default_writer_lock:
+            if _default_writer is None:
+                _default_writer = AsyncManifestWriter()
+                atexit.register(_shutdown_default_writer)
+    _default_writer.submit(manifest, path)
+
 
 def load_manifest(path: Path) -> AtlasManifest:
     """
@@ -732,7 +1284,8 @@ def load_manifest(path: Path) -> AtlasManifest:
     persistência e execução.
 
     Decisões arquiteturais:
-        - O formato de persistência é JSON
+        - O formato de persistência é JSON (opcionalmente zstd/gzip,
+          detectado pelos magic bytes)
         - A desserialização delega a reconstrução semântica ao método
           `AtlasManifest.from_dict`
         - Nenhuma validação implícita adicional é aplicada além do contrato
@@ -758,5 +1311,81 @@ def load_manifest(path: Path) -> AtlasManifest:
         OSError: Em caso de falha de leitura do arquivo.
         json.JSONDecodeError: Em caso de JSON inválido.
     """
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return AtlasManifest.from_dict(data)
+    raw = _decompress_payload(path.read_bytes())
+    data = _loads_json(raw)
+    return AtlasManifest.from_dict(data, copy=False, base_dir=path.parent)
+
+
+SPLIT_MANIFEST_FILE = "manifest.json"
+SPLIT_EVENTS_FILE = "events.jsonl"
+
+
+def save_manifest_split(manifest: Union[AtlasManifest, Dict[str, Any]], directory: Path) -> None:
+    """
+    Persiste o Manifest dividido em `manifest.json` + `events.jsonl`.
+
+    `manifest.json` contém apenas `run`, `inputs` e `steps` (mesmo layout
+    determinístico de `save_manifest`); o Event Log vai para `events.jsonl`,
+    um evento por linha, em modo append.
+
+    Decisões arquiteturais:
+        - Para `AtlasManifest`, apenas eventos ainda não gravados no diretório
+          são anexados: o custo do snapshot é proporcional aos eventos novos
+        - Para Manifests em dict (sem estado de controle) o `events.jsonl` é
+          reescrito por completo
+        - `manifest.json` é substituído atomicamente
+
+    Limites explícitos:
+        - Não combina com `events_sink` (Event Log segmentado): são
+          estratégias alternativas de persistência do Event Log
+        - `save_manifest`/`load_manifest` seguem inalterados (arquivo único)
+
+    Raises:
+        ValueError: Se o Manifest possuir `events_sink` configurado.
+        OSError: Em caso de falha de escrita.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    if isinstance(manifest, AtlasManifest):
+        if manifest.events_sink is not None:
+            raise ValueError("save_manifest_split does not support manifests with events_sink")
+        head = {"run": manifest.run, "inputs": manifest.inputs, "steps": manifest.steps}
+        events = manifest.events
+        written = manifest._split_written.get(directory, 0)
+        if written > len(events):
+            written = 0
+    else:
+        head = {k: v for k, v in manifest.items() if k != "events"}
+        events = manifest.get("events", []) or []
+        written = 0
+
+    with (directory / SPLIT_EVENTS_FILE).open("ab" if written else "wb") as fh:
+        fh.write(b"".join(_encode_event_line(ev) for ev in events[written:]))
+    if isinstance(manifest, AtlasManifest):
+        manifest._split_written[directory] = len(events)
+
+    _write_atomic(directory / SPLIT_MANIFEST_FILE, _encode_manifest(head))
+
+
+def load_manifest_split(directory: Path) -> AtlasManifest:
+    """
+    Carrega um Manifest persistido por `save_manifest_split`.
+
+    O Event Log é reconstruído a partir de `events.jsonl` (ausente ⇒ vazio),
+    preservando a ordem das linhas.
+
+    Raises:
+        OSError: Em caso de falha de leitura de `manifest.json`.
+    """
+    directory = Path(directory)
+    raw = (directory / SPLIT_MANIFEST_FILE).read_bytes()
+    data = _loads_json(raw)
+
+    events_path = directory / SPLIT_EVENTS_FILE
+    if events_path.exists():
+        with events_path.open("rb") as fh:
+            data["events"] = [_loads_json(line) for line in fh if line.strip()]
+    else:
+        data["events"] = []
+    return AtlasManifest.from_dict(data, copy=False)
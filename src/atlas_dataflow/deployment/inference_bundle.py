@@ -21,13 +21,14 @@ Limites explícitos (v1):
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Sequence, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 
 import hashlib
 import io
 import json
+import sys
 
 try:
     import joblib  # type: ignore
@@ -43,11 +44,34 @@ def _sha256_bytes(b: bytes) -> str:
 
 
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: laço de leitura/hash inteiro em C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()  # pragma: no cover (Python 3.10)
+        for chunk in iter(lambda: f.read(4 * 1024 * 1024), b""):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest()
+
+
+class _HashingWriter:
+    """
+    Wrapper de arquivo que calcula SHA-256 dos bytes à medida que são escritos.
+
+    Demais atributos (tell, flush, ...) são delegados ao arquivo subjacente,
+    o que basta para `joblib.dump` (apenas escrita sequencial).
+    """
+
+    def __init__(self, f: Any) -> None:
+        self._f = f
+        self.h = hashlib.sha256()
+
+    def write(self, b: Any) -> int:
+        self.h.update(b)
+        return self._f.write(b)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._f, name)
 
 
 def _contract_feature_names(contract: Dict[str, Any]) -> List[str]:
@@ -59,7 +83,9 @@ def _contract_feature_names(contract: Dict[str, Any]) -> List[str]:
         name = f.get("name")
         if not isinstance(name, str) or not name.strip():
             raise ValueError("Invalid contract: feature.name must be a non-empty string")
-        names.append(name.strip())
+        # nomes internados: `row[col]` resolve por identidade quando a chave
+        # do payload também é internada (ex.: literais no código do chamador)
+        names.append(sys.intern(name.strip()))
     return names
 
 
@@ -75,38 +101,88 @@ def _contract_feature_dtypes(contract: Dict[str, Any]) -> Dict[str, str]:
             raise ValueError("Invalid contract: feature.name must be a non-empty string")
         if not isinstance(dtype, str) or not dtype.strip():
             raise ValueError(f"Invalid contract: feature.dtype is required for {name!r}")
-        out[name.strip()] = dtype.strip()
+        # normalizado uma única vez (carga do contrato), nunca por célula
+        out[name.strip()] = dtype.strip().lower()
     return out
 
 
-def _validate_value_dtype(expected: str, v: Any) -> bool:
+def _is_int(v: Any) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _is_float(v: Any) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def _is_bool(v: Any) -> bool:
+    return isinstance(v, bool)
+
+
+def _is_str(v: Any) -> bool:
+    return isinstance(v, str)
+
+
+def _is_present(v: Any) -> bool:
+    return v is not None
+
+
+_CHECKERS: Dict[str, Callable[[Any], bool]] = {
+    "int": _is_int,
+    "float": _is_float,
+    "bool": _is_bool,
+    "string": _is_str,
+    # categoria v1: representada como string (sem inferência de aliases)
+    "category": _is_str,
+}
+
+
+def _make_checker(expected: str) -> Callable[[Any], bool]:
     """
-    Validação explícita (v1) de compatibilidade de tipos.
+    Resolve, uma única vez por coluna, o validador explícito (v1) de
+    compatibilidade de tipos para `expected`.
 
     Importante:
     - Não faz coerções silenciosas.
     - Strings "1"/"true" NÃO são aceitas para int/bool (isso seria heurística).
+    - None é sempre rejeitado; dtypes desconhecidos caem no fallback `other`.
+
+    `expected` já vem normalizado de `_contract_feature_dtypes`. `isinstance`
+    é mantido: subclasses (ex.: numpy.float64) seguem aceitas.
     """
-    if v is None:
-        return False
-
-    exp = expected.strip().lower()
-    if exp == "int":
-        return isinstance(v, int) and not isinstance(v, bool)
-    if exp == "float":
-        return isinstance(v, (int, float)) and not isinstance(v, bool)
-    if exp == "bool":
-        return isinstance(v, bool)
-    if exp == "string":
-        return isinstance(v, str)
-    if exp == "category":
-        # categoria v1: representada como string (sem inferência de aliases)
-        return isinstance(v, str)
-    # fallback explícito: other
-    return True
-
-
-def validate_payload_against_contract(*, payload: Union[Dict[str, Any], List[Dict[str, Any]]], contract: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return _CHECKERS.get(expected, _is_present)
+
+
+@dataclass(frozen=True)
+class _ContractView:
+    """
+    Estruturas derivadas do contrato, pré-computadas uma única vez.
+
+    Evita reprocessar `contract["features"]` a cada chamada de validação
+    (ex.: `InferenceBundleV1.predict` por requisição).
+    """
+    expected_cols: Tuple[str, ...]
+    expected_set: FrozenSet[str]
+    dtypes: Dict[str, str]
+    checkers: Tuple[Tuple[str, Callable[[Any], bool]], ...]
+
+
+def _build_contract_view(contract: Dict[str, Any]) -> _ContractView:
+    expected_cols = tuple(_contract_feature_names(contract))
+    dtypes = _contract_feature_dtypes(contract)
+    return _ContractView(
+        expected_cols=expected_cols,
+        expected_set=frozenset(expected_cols),
+        dtypes=dtypes,
+        checkers=tuple((col, _make_checker(dtypes.get(col, "other"))) for col in expected_cols),
+    )
+
+
+def validate_payload_against_contract(
+    *,
+    payload: Union[Dict[str, Any], List[Dict[str, Any]]],
+    contract: Dict[str, Any],
+    view: Optional[_ContractView] = None,
+) -> List[Dict[str, Any]]:
     """
     Valida payload (single-row ou batch) contra o contrato congelado.
 
@@ -116,9 +192,32 @@ def validate_payload_against_contract(*, payload: Union[Dict[str, Any], List[Dic
     - não aceita campos faltantes
     - valida tipos conforme feature.dtype (validação estrita)
 
+    `view` (opcional) é a visão pré-computada do mesmo contrato; quando
+    ausente, é derivada de `contract` nesta chamada.
+
     Returns:
         Uma lista de dicts (normalizada) para consumo por DataFrame.
     """
+    if view is None:
+        view = _build_contract_view(contract)
+    return [dict(zip(view.expected_cols, vals)) for vals in _validated_rows(payload, view)]
+
+
+def _validated_columns(payload: Union[Dict[str, Any], List[Dict[str, Any]]], view: _ContractView) -> Dict[str, List[Any]]:
+    """
+    Mesma validação de `validate_payload_against_contract`, com saída colunar.
+
+    `{coluna: [valores]}` na ordem do contrato: o DataFrame é montado a partir
+    das colunas, sem a inversão linhas→colunas de uma lista de dicts.
+    """
+    rows = _validated_rows(payload, view)
+    if not rows:
+        return {c: [] for c in view.expected_cols}
+    return {c: list(values) for c, values in zip(view.expected_cols, zip(*rows))}
+
+
+def _validated_rows(payload: Union[Dict[str, Any], List[Dict[str, Any]]], view: _ContractView) -> List[Tuple[Any, ...]]:
+    """Valida o payload e devolve, por linha, os valores na ordem do contrato."""
     if isinstance(payload, dict):
         rows = [payload]
     elif isinstance(payload, list) and all(isinstance(r, dict) for r in payload):
@@ -126,33 +225,47 @@ def validate_payload_against_contract(*, payload: Union[Dict[str, Any], List[Dic
     else:
         raise ValueError("Invalid payload: expected dict or list[dict]")
 
-    expected_cols = _contract_feature_names(contract)
-    expected_set = set(expected_cols)
-
-    dtypes = _contract_feature_dtypes(contract)
+    expected_cols = view.expected_cols
+    expected_set = view.expected_set
+    dtypes = view.dtypes
 
+    # Passo único: valida e normaliza (ordem estável de colunas) cada linha.
+    # Caminho feliz sem sets: mesmo tamanho + todas as colunas presentes
+    # implica ausência de extras; diferenças de forma caem em `_check_columns`.
+    n_expected = len(expected_cols)
+    normalized: List[Tuple[Any, ...]] = []
     for i, row in enumerate(rows):
-        keys = set(row.keys())
-        missing = sorted(expected_set - keys)
-        extra = sorted(keys - expected_set)
-        if missing:
-            raise ValueError(f"Invalid payload: missing columns at row {i}: {missing}")
-        if extra:
-            raise ValueError(f"Invalid payload: extra columns at row {i}: {extra}")
-
-        # dtype checks (estrito)
-        for col in expected_cols:
-            exp = dtypes.get(col, "other")
-            if not _validate_value_dtype(exp, row.get(col)):
+        if len(row) != n_expected:
+            _check_columns(row, expected_set, i)
+
+        out: List[Any] = []
+        for col, check in view.checkers:
+            try:
+                v = row[col]
+            except KeyError:
+                _check_columns(row, expected_set, i)
+                raise
+            if not check(v):
+                # coluna faltante tem precedência sobre dtype (mesma ordem de antes)
+                _check_columns(row, expected_set, i)
+                exp = dtypes.get(col, "other")
                 raise ValueError(f"Invalid payload: incompatible dtype for column={col!r} expected={exp!r} at row {i}")
-
-    # garante estabilidade de colunas (ordem)
-    normalized: List[Dict[str, Any]] = []
-    for row in rows:
-        normalized.append({c: row[c] for c in expected_cols})
+            out.append(v)
+        normalized.append(tuple(out))
     return normalized
 
 
+def _check_columns(row: Dict[str, Any], expected_set: FrozenSet[str], i: int) -> None:
+    """Caminho lento: levanta erro de colunas faltantes/extras da linha `i`."""
+    keys = set(row.keys())
+    missing = sorted(expected_set - keys)
+    extra = sorted(keys - expected_set)
+    if missing:
+        raise ValueError(f"Invalid payload: missing columns at row {i}: {missing}")
+    if extra:
+        raise ValueError(f"Invalid payload: extra columns at row {i}: {extra}")
+
+
 @dataclass(frozen=True)
 class InferenceBundleV1:
     """
@@ -171,15 +284,27 @@ class InferenceBundleV1:
     metrics: Dict[str, Any]
     metadata: Dict[str, Any]
 
+    # Visão do contrato derivada sob demanda (cache; não faz parte da identidade)
+    _contract_view: Optional[_ContractView] = field(default=None, init=False, repr=False, compare=False)
+
+    def _view(self) -> _ContractView:
+        view = self._contract_view
+        if view is None:
+            view = _build_contract_view(self.contract)
+            # dataclass congelada: cache atribuído explicitamente
+            object.__setattr__(self, "_contract_view", view)
+        return view
+
     def predict(self, payload: Union[Dict[str, Any], List[Dict[str, Any]]]):
-        rows = validate_payload_against_contract(payload=payload, contract=self.contract)
+        view = self._view()
+        columns = _validated_columns(payload, view)
 
         try:
             import pandas as pd  # type: ignore
         except Exception as e:  # pragma: no cover
             raise RuntimeError("pandas is required for inference bundle predict") from e
 
-        X = pd.DataFrame(rows)
+        X = pd.DataFrame(columns, columns=list(view.expected_cols))
 
         if not hasattr(self.preprocess, "transform"):
             raise ValueError("Invalid bundle: preprocess has no transform()")
@@ -195,14 +320,15 @@ class InferenceBundleV1:
         if not hasattr(self.model, "predict_proba"):
             raise AttributeError("Model does not support predict_proba()")
 
-        rows = validate_payload_against_contract(payload=payload, contract=self.contract)
+        view = self._view()
+        columns = _validated_columns(payload, view)
 
         try:
             import pandas as pd  # type: ignore
         except Exception as e:  # pragma: no cover
             raise RuntimeError("pandas is required for inference bundle predict_proba") from e
 
-        X = pd.DataFrame(rows)
+        X = pd.DataFrame(columns, columns=list(view.expected_cols))
         Xt = self.preprocess.transform(X)
         return self.model.predict_proba(Xt)
 
@@ -227,9 +353,11 @@ def save_inference_bundle_v1(*, bundle: InferenceBundleV1, path: Union[str, Path
         "metrics": bundle.metrics,
         "metadata": bundle.metadata,
     }
-    joblib.dump(payload, p)
-
-    file_hash = _sha256_file(p)
+    # Hash calculado durante a escrita: evita reler o arquivo inteiro.
+    with p.open("wb") as f:
+        writer = _HashingWriter(f)
+        joblib.dump(payload, writer)
+    file_hash = writer.h.hexdigest()
     return {"bundle_path": str(p), "bundle_hash": file_hash, "format": "joblib", "version": "v1"}
 
 
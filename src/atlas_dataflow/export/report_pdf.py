@@ -14,12 +14,15 @@ Rules:
 Engines:
 - "simple": built-in, pure-Python minimal PDF generator (CI-safe, no external deps)
 - "reportlab": optional engine if reportlab is installed
+- "mistune": optional engine (mistune AST + reportlab) if both are installed
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from html import escape as _xml_escape
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
 
@@ -77,18 +80,21 @@ def convert_md_to_pdf(
 # Built-in engine (v1): simple (pure-Python, minimal PDF)
 # -----------------------------------------------------------------------------
 
+# Escape parens and backslashes for PDF literal strings (single C-level pass)
+_PDF_ESCAPE = str.maketrans({"\\": "\\\\", "(": "\\(", ")": "\\)"})
+
+
 def _escape_pdf_text(s: str) -> str:
-    # Escape parens and backslashes for PDF literal strings
-    return s.replace("\\\\", "\\\\\\\\").replace("(", "\\\\(").replace(")", "\\\\)")
+    return s.translate(_PDF_ESCAPE)
 
 
 def _read_md_lines(md_path: Path) -> List[str]:
-    lines: List[str] = []
-    with md_path.open("r", encoding="utf-8") as f:
-        for raw in f.readlines():
-            line = raw.rstrip("\\n").rstrip("\\r")
-            lines.append(line)
-    return lines
+    # splitlines handles LF, CR and CRLF in C; no per-line rstrip needed
+    return md_path.read_text(encoding="utf-8").splitlines()
+
+
+_HEAD_LEVEL = {"#": 1, "##": 2, "###": 3}
+_BULLET = frozenset({"-", "*"})
 
 
 def _normalize_md_to_plain(lines: List[str]) -> List[Tuple[int, str]]:
@@ -100,24 +106,70 @@ def _normalize_md_to_plain(lines: List[str]) -> List[Tuple[int, str]]:
     - 0 for normal text
     """
     out: List[Tuple[int, str]] = []
+    append = out.append
     for ln in lines:
         s = ln.strip()
         if not s:
-            out.append((0, ""))
+            append((0, ""))
             continue
-        if s.startswith("# "):
-            out.append((1, s[2:].strip()))
-        elif s.startswith("## "):
-            out.append((2, s[3:].strip()))
-        elif s.startswith("### "):
-            out.append((3, s[4:].strip()))
-        elif s.startswith("- ") or s.startswith("* "):
-            out.append((0, f"• {s[2:].strip()}"))
-        else:
-            out.append((0, s))
+        # One partition + one dict lookup instead of a startswith cascade
+        head, sep, rest = s.partition(" ")
+        if sep:
+            level = _HEAD_LEVEL.get(head)
+            if level is not None:
+                append((level, rest.strip()))
+                continue
+            if head in _BULLET:
+                append((0, f"• {rest.strip()}"))
+                continue
+        append((0, s))
     return out
 
 
+# Parse cache: the same report.md is often exported more than once per process
+# (several engines/paths). Keys embed st_mtime_ns/st_size so edits invalidate
+# the entry without re-hashing; values are tuples so sharing them is safe.
+
+@lru_cache(maxsize=32)
+def _load_md_lines(path_str: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    return tuple(_read_md_lines(Path(path_str)))
+
+
+@lru_cache(maxsize=32)
+def _load_normalized(path_str: str, mtime_ns: int, size: int) -> Tuple[Tuple[int, str], ...]:
+    return tuple(_normalize_md_to_plain(list(_load_md_lines(path_str, mtime_ns, size))))
+
+
+def _md_cache_key(md_path: Path) -> Tuple[str, int, int]:
+    st = md_path.stat()
+    return str(md_path), st.st_mtime_ns, st.st_size
+
+
+def _pdf_obj(n: int, body: bytes) -> bytes:
+    return b"%d 0 obj\n%b\nendobj\n" % (n, body)
+
+
+# Fixed PDF fragments (identical for every conversion), encoded once at import
+_PDF_HEADER = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+_OBJ_CATALOG = _pdf_obj(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+_OBJ_PAGES = _pdf_obj(2, b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>")
+_OBJ_FONT = _pdf_obj(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+
+@lru_cache(maxsize=8)
+def _page_obj(width: int, height: int) -> bytes:
+    # Page sizes come from a small set (A4 by default)
+    return _pdf_obj(
+        3,
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>" % (width, height),
+    )
+
+
+# Font size per heading level (0 = body text)
+_FONT_SIZE = {1: 16, 2: 14, 3: 12}
+
+
 @dataclass(frozen=True)
 class SimplePdfEngine(PdfEngine):
     """
@@ -138,99 +190,77 @@ class SimplePdfEngine(PdfEngine):
         margin_top = int(opts.get("margin_top", 60))
         line_gap = int(opts.get("line_gap", 14))
 
-        md_lines = _read_md_lines(md_path)
-        items = _normalize_md_to_plain(md_lines)
+        items = _load_normalized(*_md_cache_key(md_path))
 
         # Build PDF content stream with basic text drawing
         y = height - margin_top
 
-        content_ops: List[str] = []
-        content_ops.append("BT")  # begin text
+        # Operators are ASCII: build bytes directly, encoding only the text
+        content_ops: List[bytes] = []
+        content_ops.append(b"BT")  # begin text
 
         def set_font(size: int) -> None:
-            content_ops.append(f"/F1 {size} Tf")
+            content_ops.append(b"/F1 %d Tf" % size)
 
         def move_to(x: int, y_: int) -> None:
-            content_ops.append(f"{x} {y_} Td")
+            content_ops.append(b"%d %d Td" % (x, y_))
 
         set_font(11)
-        move_to(margin_left, y)
+        current_font = 11
+        # Leading set once (TL): each line is then a single operator. The "'"
+        # operator moves to the next line before showing text, so the cursor
+        # starts one line above the first baseline.
+        content_ops.append(b"%d TL" % line_gap)
+        move_to(margin_left, y + line_gap)
 
         for level, text in items:
             if y < 50:
                 # v1 limit: one page only. If overflow, truncate deterministically.
                 break
 
+            y -= line_gap
             if text == "":
-                y -= line_gap
-                content_ops.append(f"0 {-line_gap} Td")
+                content_ops.append(b"T*")
                 continue
 
-            if level == 1:
-                set_font(16)
-            elif level == 2:
-                set_font(14)
-            elif level == 3:
-                set_font(12)
-            else:
-                set_font(11)
+            # Tf is emitted only when the size actually changes
+            size = _FONT_SIZE.get(level, 11)
+            if size != current_font:
+                set_font(size)
+                current_font = size
 
-            esc = _escape_pdf_text(text)
-            content_ops.append(f"({esc}) Tj")
-            y -= line_gap
-            content_ops.append(f"0 {-line_gap} Td")
-
-        content_ops.append("ET")  # end text
-        content_stream = "\\n".join(content_ops).encode("latin-1", "replace")
-
-        # Minimal PDF with xref
-        objects: List[bytes] = []
-
-        def obj(n: int, body: bytes) -> bytes:
-            return f"{n} 0 obj\\n".encode() + body + b"\\nendobj\\n"
-
-        objects.append(obj(1, b"<< /Type /Catalog /Pages 2 0 R >>"))
-        objects.append(obj(2, b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>"))
-        objects.append(
-            obj(
-                3,
-                (
-                    f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] "
-                    f"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>"
-                ).encode(),
-            )
-        )
-        objects.append(obj(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"))
-        objects.append(
-            obj(
-                5,
-                f"<< /Length {len(content_stream)} >>\\nstream\\n".encode()
-                + content_stream
-                + b"\\nendstream",
-            )
-        )
+            esc = _escape_pdf_text(text).encode("latin-1", "replace")
+            content_ops.append(b"(%b) '" % esc)
 
-        out = bytearray()
-        out.extend(b"%PDF-1.4\\n%\\xe2\\xe3\\xcf\\xd3\\n")
+        content_ops.append(b"ET")  # end text
+        content_stream = b"\n".join(content_ops)
 
-        offsets = [0]
-        for o in objects:
-            offsets.append(len(out))
-            out.extend(o)
-
-        xref_start = len(out)
-        out.extend(f"xref\\n0 {len(offsets)}\\n".encode())
-        out.extend(b"0000000000 65535 f \\n")
-        for off in offsets[1:]:
-            out.extend(f"{off:010d} 00000 n \\n".encode())
+        # Minimal PDF with xref: objects 1, 2 and 4 are input-independent constants.
+        # Fragments are appended and their offsets recorded in the same pass.
+        parts: List[bytes] = [_PDF_HEADER]
+        pos = len(_PDF_HEADER)
 
-        out.extend(b"trailer\\n")
-        out.extend(f"<< /Size {len(offsets)} /Root 1 0 R >>\\n".encode())
-        out.extend(b"startxref\\n")
-        out.extend(f"{xref_start}\\n".encode())
-        out.extend(b"%%EOF\\n")
+        offsets = [0]
+        for o in (
+            _OBJ_CATALOG,
+            _OBJ_PAGES,
+            _page_obj(width, height),
+            _OBJ_FONT,
+            _pdf_obj(5, b"<< /Length %d >>\nstream\n%b\nendstream" % (len(content_stream), content_stream)),
+        ):
+            offsets.append(pos)
+            parts.append(o)
+            pos += len(o)
+
+        xref_start = pos
+        parts.append(b"xref\n0 %d\n0000000000 65535 f \n" % len(offsets))
+        parts.append(b"".join([b"%010d 00000 n \n" % off for off in offsets[1:]]))
+        parts.append(
+            b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(offsets), xref_start)
+        )
 
-        pdf_path.write_bytes(bytes(out))
+        pdf_path.write_bytes(b"".join(parts))
 
 
 # -----------------------------------------------------------------------------
@@ -257,24 +287,126 @@ class ReportLabEngine(PdfEngine):
         styles = getSampleStyleSheet()
         story = []
 
-        with md_path.open("r", encoding="utf-8") as f:
-            for raw in f.readlines():
-                line = raw.rstrip()
-
-                if not line:
-                    story.append(Spacer(1, 8))
-                    continue
-
-                if line.startswith("# "):
-                    story.append(Paragraph(f"<b>{line[2:]}</b>", styles["Heading1"]))
-                elif line.startswith("## "):
-                    story.append(Paragraph(f"<b>{line[3:]}</b>", styles["Heading2"]))
-                elif line.startswith("### "):
-                    story.append(Paragraph(f"<b>{line[4:]}</b>", styles["Heading3"]))
-                elif line.startswith("- ") or line.startswith("* "):
-                    story.append(ListFlowable([ListItem(Paragraph(line[2:], styles["Normal"]))]))
-                else:
-                    story.append(Paragraph(line, styles["Normal"]))
+        for raw in _load_md_lines(*_md_cache_key(md_path)):
+            line = raw.rstrip()
+
+            if not line:
+                story.append(Spacer(1, 8))
+                continue
+
+            if line.startswith("# "):
+                story.append(Paragraph(f"<b>{line[2:]}</b>", styles["Heading1"]))
+            elif line.startswith("## "):
+                story.append(Paragraph(f"<b>{line[3:]}</b>", styles["Heading2"]))
+            elif line.startswith("### "):
+                story.append(Paragraph(f"<b>{line[4:]}</b>", styles["Heading3"]))
+            elif line.startswith("- ") or line.startswith("* "):
+                story.append(ListFlowable([ListItem(Paragraph(line[2:], styles["Normal"]))]))
+            else:
+                story.append(Paragraph(line, styles["Normal"]))
+
+        doc = SimpleDocTemplate(
+            str(pdf_path),
+            pagesize=A4,
+            rightMargin=36,
+            leftMargin=36,
+            topMargin=36,
+            bottomMargin=36,
+        )
+        doc.build(story)
+
+
+# -----------------------------------------------------------------------------
+# Optional engine: mistune (AST) + reportlab (if both are installed)
+# -----------------------------------------------------------------------------
+
+def _inline_text(children: Any) -> str:
+    """Flatten mistune inline tokens to plain text."""
+    parts: List[str] = []
+    for tok in children or ():
+        if "children" in tok:
+            parts.append(_inline_text(tok["children"]))
+        elif tok.get("type") in ("softbreak", "linebreak"):
+            parts.append(" ")
+        else:
+            parts.append(tok.get("raw", ""))
+    return "".join(parts)
+
+
+class MistuneEngine(PdfEngine):
+    """
+    Markdown parsed by mistune (>= 3) into an AST, rendered with reportlab.
+
+    - The parser is built once per engine instance and reused across
+      conversions (mistune parsers are reusable).
+    - Source lines come from the same per-file cache as the other engines.
+    - Block structure is kept: fenced/indented code as preformatted text,
+      nested and ordered lists as nested list flowables.
+    """
+    name = "mistune"
+
+    def __init__(self) -> None:
+        import mistune  # type: ignore
+
+        self._md = mistune.create_markdown(renderer=None)
+
+    def _flowables(self, tokens: Any, rl: Dict[str, Any]) -> List[Any]:
+        styles = rl["styles"]
+        out: List[Any] = []
+        for tok in tokens or ():
+            kind = tok.get("type")
+            if kind == "heading":
+                level = min(int(tok.get("attrs", {}).get("level", 1)), 3)
+                text = _xml_escape(_inline_text(tok.get("children")), quote=False)
+                out.append(rl["Paragraph"](f"<b>{text}</b>", styles[f"Heading{level}"]))
+            elif kind == "block_code":
+                out.append(rl["Preformatted"](tok.get("raw", "").rstrip("\n"), styles["Code"]))
+            elif kind == "list":
+                items = [
+                    rl["ListItem"](self._flowables(it.get("children"), rl))
+                    for it in tok.get("children", ())
+                ]
+                ordered = bool(tok.get("attrs", {}).get("ordered"))
+                out.append(rl["ListFlowable"](items, bulletType="1" if ordered else "bullet"))
+            elif kind == "block_quote":
+                out.extend(self._flowables(tok.get("children"), rl))
+            elif kind in ("blank_line", "thematic_break"):
+                out.append(rl["Spacer"](1, 8))
+            else:
+                # paragraph / block_text / block_html
+                text = _inline_text(tok["children"]) if "children" in tok else tok.get("raw", "")
+                if text:
+                    out.append(rl["Paragraph"](_xml_escape(text, quote=False), styles["Normal"]))
+        return out
+
+    def _build_story(self, text: str) -> List[Any]:
+        try:
+            from reportlab.lib.styles import getSampleStyleSheet
+            from reportlab.platypus import (
+                Paragraph,
+                Preformatted,
+                Spacer,
+                ListFlowable,
+                ListItem,
+            )
+        except Exception as e:  # pragma: no cover
+            raise RuntimeError("reportlab is required for the 'mistune' engine") from e
+
+        rl = {
+            "styles": getSampleStyleSheet(),
+            "Paragraph": Paragraph,
+            "Preformatted": Preformatted,
+            "Spacer": Spacer,
+            "ListFlowable": ListFlowable,
+            "ListItem": ListItem,
+        }
+        return self._flowables(self._md(text), rl)
+
+    def convert(self, md_path: Path, pdf_path: Path, **opts: Any) -> None:
+        story = self._build_story("\n".join(_load_md_lines(*_md_cache_key(md_path))))
+
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate
 
         doc = SimpleDocTemplate(
             str(pdf_path),
@@ -297,6 +429,14 @@ try:  # pragma: no cover
 except Exception:  # pragma: no cover
     pass
 
+# mistune engine needs mistune (parser) and reportlab (rendering)
+try:  # pragma: no cover
+    import mistune  # type: ignore  # noqa: F401
+    import reportlab  # type: ignore  # noqa: F401
+    register_engine(MistuneEngine())
+except Exception:  # pragma: no cover
+    pass
+
 
 __all__ = [
     "PdfEngine",
@@ -10,12 +10,14 @@ Invariantes:
 - determinístico (sem acessar dados)
 - sem execução de busca / treino
 - falha explícita para model_id inválido
-- valida que parâmetros do grid existem no estimador
+- valida que parâmetros do grid existem no estimador (via assinatura do construtor)
 """
 
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from sklearn.model_selection import StratifiedKFold
@@ -23,6 +25,16 @@ from sklearn.model_selection import StratifiedKFold
 from .model_registry import ModelRegistry
 
 
+@lru_cache(maxsize=None)
+def _init_param_names(estimator_cls: type) -> frozenset:
+    """Nomes aceitos pelo construtor (sem instanciar o estimador).
+
+    Equivale às chaves de `get_params()` para estimadores sklearn, que por
+    convenção expõem exatamente os argumentos de `__init__`.
+    """
+    return frozenset(inspect.signature(estimator_cls).parameters)
+
+
 @dataclass(frozen=True)
 class CvConfig:
     """Configuração serializável de CV (v1).
@@ -143,8 +155,7 @@ class DefaultSearchGrids:
 
         # Valida que todos os params existem no estimador
         for mid, spec in specs.items():
-            estimator = mr.build(mid)
-            est_params = estimator.get_params(deep=True)
+            est_params = _init_param_names(mr.get(mid).estimator_cls)
             for p in spec.param_grid.keys():
                 if p not in est_params:
                     raise ValueError(f"grid param '{p}' not found in estimator params for model_id '{mid}'")
@@ -17,21 +17,44 @@ Saídas:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Mapping, Sequence, Optional
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Sequence, Optional
 import copy
 import html
 import json
+import re
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RenderResult:
     """Resultado de renderização (apenas apresentação)."""
     html: Optional[str]  # HTML string (quando aplicável)
     text: str            # fallback textual (sempre preenchido)
 
 
+# Caracteres tratados por `html.escape(quote=True)`; a maioria das células
+# (números/identificadores) não contém nenhum e é devolvida sem cópia.
+_NEEDS_ESCAPE = re.compile(r"[&<>\"']").search
+
+
 def _escape(s: Any) -> str:
-    return html.escape("" if s is None else str(s))
+    if s is None:
+        return ""
+    s = str(s)
+    return html.escape(s) if _NEEDS_ESCAPE(s) else s
+
+
+_IMMUTABLE_SCALARS = (str, bytes, int, float, bool, type(None), MappingProxyType)
+
+
+def _is_immutable(x: Any) -> bool:
+    """True se `x` não pode ser mutado (escalares, proxies, tuplas/frozensets de imutáveis)."""
+    if isinstance(x, _IMMUTABLE_SCALARS):
+        return True
+    if isinstance(x, (tuple, frozenset)):
+        return all(map(_is_immutable, x))
+    return False
 
 
 def _as_pretty_json(payload: Any) -> str:
@@ -41,7 +64,7 @@ def _as_pretty_json(payload: Any) -> str:
         return repr(payload)
 
 
-def render_payload(payload: Any) -> RenderResult:
+def render_payload(payload: Any, *, check_purity: bool = False) -> RenderResult:
     """
     Renderizador genérico v1:
     - dict com chaves simples -> tenta tabela key/value
@@ -49,11 +72,19 @@ def render_payload(payload: Any) -> RenderResult:
     - caso contrário -> JSON pretty (fallback)
 
     Garantia de pureza:
-    - Verificada explicitamente apenas para tipos mutáveis suportados (dict, list).
+    - Os renderers são somente-leitura (apenas `.keys()`/`.get()`/indexação).
+    - Com `check_purity=True` a não-mutação é verificada explicitamente
+      (deepcopy antes/depois) para tipos mutáveis suportados (dict, list);
+      desligado por padrão, pois triplica o custo em payloads grandes.
     - Tipos opacos/imutáveis (ex.: object()) não são comparados por deepcopy.
     """
-    # Pureza: só validamos não-mutação para tipos mutáveis comuns
-    before = copy.deepcopy(payload) if isinstance(payload, (dict, list)) else None
+    # Pureza: só validamos não-mutação para tipos mutáveis comuns. Se todos
+    # os valores são imutáveis, uma cópia rasa já é um snapshot fiel.
+    check = check_purity and isinstance(payload, (dict, list))
+    before = None
+    if check:
+        values = payload.values() if isinstance(payload, dict) else payload
+        before = payload.copy() if all(map(_is_immutable, values)) else copy.deepcopy(payload)
 
     html_out: Optional[str] = None
     text_out: str
@@ -67,8 +98,7 @@ def render_payload(payload: Any) -> RenderResult:
     else:
         text_out = _as_pretty_json(payload)
 
-    after = copy.deepcopy(payload) if isinstance(payload, (dict, list)) else None
-    if before is not None and before != after:
+    if check and before != payload:
         raise AssertionError("Notebook UI renderer mutated the input payload")
 
     return RenderResult(html=html_out, text=text_out)
@@ -76,30 +106,30 @@ def render_payload(payload: Any) -> RenderResult:
 
 def render_kv_table_html(payload: Mapping[str, Any], title: Optional[str] = None) -> str:
     """Renderiza dict como tabela key/value (HTML puro)."""
-    rows = []
-    for k in payload.keys():
-        rows.append(
-            f"<tr><td><code>{_escape(k)}</code></td><td>{_escape(payload[k])}</td></tr>"
-        )
+    esc = _escape  # local: evita lookup global por célula
+    rows = "".join(
+        f"<tr><td><code>{esc(k)}</code></td><td>{esc(v)}</td></tr>" for k, v in payload.items()
+    )
 
     heading = f"<h4>{_escape(title)}</h4>" if title else ""
     return (
         f"{heading}"
         "<table>"
         "<thead><tr><th>key</th><th>value</th></tr></thead>"
-        "<tbody>"
-        + "".join(rows) +
-        "</tbody></table>"
+        f"<tbody>{rows}</tbody></table>"
     )
 
 
-def render_table_html(payload: Sequence[Any], title: Optional[str] = None, max_rows: int = 50) -> str:
+def render_table_html(payload: Iterable[Any], title: Optional[str] = None, max_rows: int = 50) -> str:
     """
     Renderiza list payload como tabela:
     - list[dict] -> colunas = união das chaves (ordem estável)
     - caso contrário -> tabela de 1 coluna (value)
+
+    Aceita qualquer iterável; apenas os primeiros `max_rows` itens são
+    consumidos (custo O(max_rows), independente do tamanho do payload).
     """
-    items = list(payload)[:max_rows]
+    items = list(islice(payload, max_rows))
 
     heading = f"<h4>{_escape(title)}</h4>" if title else ""
 
@@ -116,21 +146,24 @@ def render_table_html(payload: Sequence[Any], title: Optional[str] = None, max_r
                 if k not in seen:
                     columns.append(k); seen.add(k)
 
-        th = "".join(f"<th>{_escape(c)}</th>" for c in columns)
-        trs = []
-        for row in items:
-            tds = "".join(f"<td>{_escape(row.get(c))}</td>" for c in columns)
-            trs.append(f"<tr>{tds}</tr>")
+        esc = _escape  # local: evita lookup global por célula
+        cols = tuple(columns)
+        th = "".join(f"<th>{esc(c)}</th>" for c in cols)
+        trs = "".join(
+            "<tr>" + "".join([f"<td>{esc(row.get(c))}</td>" for c in cols]) + "</tr>"
+            for row in items
+        )
 
         return (
             f"{heading}"
             "<table>"
             f"<thead><tr>{th}</tr></thead>"
-            "<tbody>" + "".join(trs) + "</tbody>"
+            f"<tbody>{trs}</tbody>"
             "</table>"
         )
 
-    trs = "".join(f"<tr><td>{_escape(x)}</td></tr>" for x in items)
+    esc = _escape
+    trs = "".join(f"<tr><td>{esc(x)}</td></tr>" for x in items)
     return (
         f"{heading}"
         "<table>"
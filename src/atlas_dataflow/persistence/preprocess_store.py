@@ -12,8 +12,12 @@ ser persistido de forma **explícita** e **rastreável**, garantindo:
 Este módulo implementa uma Store minimalista, sem acoplamento com Engine.
 
 Decisões (v1):
-- Formato: joblib
+- Formato: pickle protocolo 5 (padrão; legível também por `joblib.load`) ou
+  joblib (`serializer="joblib"`, compat com artefatos existentes)
 - Caminho determinístico (relativo ao run_dir): artifacts/preprocess.joblib
+- Compressão opcional (`compress=True`): o pickle é transmitido em streaming
+  por um frame zstd (sem materializar o buffer comprimido inteiro em memória)
+- O load detecta o formato pelo conteúdo do arquivo (magic bytes)
 - Metadata registrada no Manifest via Event Log (evento explícito)
 
 Limites explícitos:
@@ -24,10 +28,11 @@ Limites explícitos:
 
 from __future__ import annotations
 
+import pickle
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 
 try:
@@ -38,6 +43,47 @@ except Exception as e:  # pragma: no cover
 else:
     _JOBLIB_IMPORT_ERROR = None
 
+try:
+    # zstandard é opcional: compressão em streaming do artefato
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+
+Serializer = Literal["pickle", "joblib"]
+
+# Marcador presente em pickles gerados por `joblib.dump` com arrays numpy
+# (NumpyArrayWrapper); esses arquivos exigem `joblib.load`.
+_JOBLIB_MARKER = b"joblib.numpy_pickle"
+
+
+def _is_plain_pickle(data: bytes) -> bool:
+    """True se `data` é um pickle padrão (protocolo >= 2) sem wrappers do joblib."""
+    return data[:1] == b"\x80" and _JOBLIB_MARKER not in data
+
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def load_preprocess_artifact(path: Union[str, Path]) -> Any:
+    """Carrega um artefato de preprocess detectando o formato (zstd, pickle, joblib)."""
+    path = Path(path)
+    with path.open("rb") as f:
+        if f.read(4) == _ZSTD_MAGIC:
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read compressed preprocess artifacts")
+            f.seek(0)
+            with zstandard.ZstdDecompressor().stream_reader(f) as r:
+                return pickle.load(r)
+
+    data = path.read_bytes()
+    if _is_plain_pickle(data):
+        return pickle.loads(data)
+
+    if joblib is None:  # pragma: no cover
+        raise RuntimeError("joblib is required for preprocess persistence") from _JOBLIB_IMPORT_ERROR
+    return joblib.load(path)
+
 
 @dataclass(frozen=True)
 class PreprocessArtifactMeta:
@@ -86,45 +132,69 @@ class PreprocessStore:
         manifest: Optional[Union[Dict[str, Any], Any]] = None,
         builder_id: str = "representation.preprocess",
         version: str = "v1",
+        serializer: Serializer = "pickle",
+        compress: bool = False,
+        event_buffer: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
-        """Salva o preprocess em joblib e (opcionalmente) registra no Manifest.
+        """Salva o preprocess e (opcionalmente) registra no Manifest.
 
         Args:
             preprocess: Objeto sklearn já construído (idealmente já fitado).
             manifest: AtlasManifest ou dict do Manifest (opcional).
             builder_id: Builder de origem (default: representation.preprocess).
             version: versão do artefato (default: v1).
+            serializer: "pickle" (protocolo 5, C pickler; padrão) ou "joblib".
+            compress: Transmite o pickle por zstd (nível 3, multithread); exige
+                `zstandard` e `serializer="pickle"`.
+            event_buffer: Se fornecido, o evento `artifact_saved` é acumulado
+                nesta lista em vez de ir direto ao Manifest; descarregue com
+                `PreprocessStore.flush_events` (um único `add_events`).
 
         Returns:
             Dict[str, Any]: metadata do artefato (serializável).
         """
-        if joblib is None:  # pragma: no cover
+        if serializer not in ("pickle", "joblib"):
+            raise ValueError(f"Unsupported serializer: {serializer}")
+        if serializer == "joblib" and joblib is None:  # pragma: no cover
             raise RuntimeError("joblib is required for preprocess persistence") from _JOBLIB_IMPORT_ERROR
+        if compress:
+            if serializer != "pickle":
+                raise ValueError("compress=True requires serializer='pickle'")
+            if zstandard is None:
+                raise RuntimeError("zstandard is required for compressed preprocess persistence")
 
         path = self.artifact_path()
         path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump(preprocess, path)
+        if compress:
+            cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+            with path.open("wb") as raw, cctx.stream_writer(raw) as w:
+                pickle.dump(preprocess, w, protocol=pickle.HIGHEST_PROTOCOL)
+        elif serializer == "pickle":
+            with path.open("wb") as f:
+                pickle.dump(preprocess, f, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            joblib.dump(preprocess, path)
 
         meta = PreprocessArtifactMeta(
+            format="pickle+zstd" if compress else serializer,
             path=self.artifact_rel_path(),
             builder=builder_id,
             version=version,
         ).to_dict()
 
-        if manifest is not None:
+        if event_buffer is not None:
+            event_buffer.append(self._artifact_event(meta))
+        elif manifest is not None:
             self._record_manifest(manifest, meta)
 
         return meta
 
     def load(self) -> Any:
-        """Carrega o preprocess persistido (joblib) sem recalcular."""
-        if joblib is None:  # pragma: no cover
-            raise RuntimeError("joblib is required for preprocess persistence") from _JOBLIB_IMPORT_ERROR
-
+        """Carrega o preprocess persistido (pickle, pickle+zstd ou joblib) sem recalcular."""
         path = self.artifact_path()
         if not path.exists():
             raise FileNotFoundError(str(path))
-        return joblib.load(path)
+        return load_preprocess_artifact(path)
 
     # ------------------------------------------------------------------
     # Manifest integration
@@ -138,14 +208,25 @@ class PreprocessStore:
         """
         from atlas_dataflow.core.traceability.manifest import add_event
 
-        ts = datetime.now(timezone.utc)
-        add_event(
-            manifest,
-            event_type="artifact_saved",
-            ts=ts,
-            step_id=None,
-            payload={"artifact": dict(meta)},
-        )
+        add_event(manifest, **self._artifact_event(meta))
+
+    @staticmethod
+    def _artifact_event(meta: Dict[str, Any]) -> Dict[str, Any]:
+        """Evento `artifact_saved` no formato aceito por `add_event`/`add_events`."""
+        return {
+            "event_type": "artifact_saved",
+            "ts": datetime.now(timezone.utc),
+            "step_id": None,
+            "payload": {"artifact": dict(meta)},
+        }
+
+    @staticmethod
+    def flush_events(manifest: Union[Dict[str, Any], Any], buffer: List[Dict[str, Any]]) -> None:
+        """Registra eventos acumulados via `event_buffer` em uma única operação e esvazia o buffer."""
+        from atlas_dataflow.core.traceability.manifest import add_events
+
+        add_events(manifest, buffer)
+        buffer.clear()
 
 
-__all__ = ["PreprocessStore", "PreprocessArtifactMeta"]
+__all__ = ["PreprocessStore", "PreprocessArtifactMeta", "load_preprocess_artifact"]
@@ -24,9 +24,12 @@ Estrutura mínima obrigatória:
 
 from __future__ import annotations
 
-import json
+import io
 from typing import Any, Dict, Iterable, List, Tuple
 
+# Mesmo encoder do Manifest: orjson apenas quando a saída é idêntica à do `json`
+from atlas_dataflow.core.traceability.manifest import dumps_deterministic_json
+
 
 REQUIRED_SECTIONS: List[str] = [
     "# Execution Report",
@@ -48,8 +51,9 @@ def _sorted_items(d: Any) -> List[Tuple[str, Any]]:
 
 
 def _as_pretty_json(value: Any) -> str:
-    # Deterministic JSON rendering for payload excerpts
-    return json.dumps(value, ensure_ascii=False, sort_keys=True, indent=2)
+    # Deterministic JSON rendering for payload excerpts (indent 2, sorted keys).
+    # Mesmo texto com ou sem orjson instalado (ver `dumps_deterministic_json`).
+    return dumps_deterministic_json(value, pretty=True).decode("utf-8")
 
 
 def _require_manifest(manifest: Dict[str, Any]) -> Dict[str, Any]:
@@ -66,9 +70,12 @@ def _extract_step(manifest: Dict[str, Any], step_id: str) -> Dict[str, Any] | No
     return step if isinstance(step, dict) else None
 
 
-def _collect_artifacts_from_steps(steps: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _collect_artifacts_from_steps(
+    sorted_steps: Iterable[Tuple[str, Any]],
+) -> List[Dict[str, Any]]:
+    # Recebe os pares (step_id, step) já ordenados por `generate_report_md`
     out: List[Dict[str, Any]] = []
-    for step_id, step in _sorted_items(steps):
+    for step_id, step in sorted_steps:
         if not isinstance(step, dict):
             continue
         artifacts = step.get("artifacts")
@@ -94,99 +101,100 @@ def generate_report_md(manifest: Dict[str, Any]) -> str:
     steps = manifest.get("steps") if isinstance(manifest.get("steps"), dict) else {}
     events = manifest.get("events") if isinstance(manifest.get("events"), list) else []
 
-    lines: List[str] = []
+    # Ordenação única: reutilizada em Pipeline Overview e Generated Artifacts
+    sorted_steps = _sorted_items(steps)
+
+    # Escrita incremental: cada linha já sai terminada em "\n"; a última
+    # linha do relatório é escrita sem terminador (mesmo formato de um
+    # "\n".join das linhas).
+    buf = io.StringIO()
+    w = buf.write
 
     # Title
-    lines.append("# Execution Report\n")
+    w("# Execution Report\n\n")
 
     # Executive Summary (no inference: only what is explicitly recorded)
-    lines.append("## Executive Summary")
+    w("## Executive Summary\n")
     run_id = run.get("run_id", "<unknown>")
     started_at = run.get("started_at", "<unknown>")
     atlas_version = run.get("atlas_version", "<unknown>")
-    lines.append(f"- **Run ID**: `{run_id}`")
-    lines.append(f"- **Started At (UTC)**: `{started_at}`")
-    lines.append(f"- **Atlas Version**: `{atlas_version}`")
-    lines.append("\nThis report consolidates the pipeline execution strictly from the Manifest.")
-    lines.append("If something is absent here, it was absent from the Manifest.\n")
+    w(f"- **Run ID**: `{run_id}`\n")
+    w(f"- **Started At (UTC)**: `{started_at}`\n")
+    w(f"- **Atlas Version**: `{atlas_version}`\n")
+    w("\nThis report consolidates the pipeline execution strictly from the Manifest.\n")
+    w("If something is absent here, it was absent from the Manifest.\n\n")
 
     # Pipeline Overview
-    lines.append("## Pipeline Overview")
+    w("## Pipeline Overview\n")
     if steps:
-        for step_id, step in _sorted_items(steps):
+        for step_id, step in sorted_steps:
             if not isinstance(step, dict):
                 continue
             status = step.get("status", "unknown")
             kind = step.get("kind", "unknown")
             summary = step.get("summary") or ""
             if summary:
-                lines.append(f"- **{step_id}** (`{kind}`) — status: `{status}` — {summary}")
+                w(f"- **{step_id}** (`{kind}`) — status: `{status}` — {summary}\n")
             else:
-                lines.append(f"- **{step_id}** (`{kind}`) — status: `{status}`")
+                w(f"- **{step_id}** (`{kind}`) — status: `{status}`\n")
     else:
-        lines.append("No steps recorded in the Manifest.")
-    lines.append("")
+        w("No steps recorded in the Manifest.\n")
+    w("\n")
 
     # Decisions & Outcomes
     # No heuristic: we surface payloads of known decision steps if present.
-    lines.append("## Decisions & Outcomes")
+    w("## Decisions & Outcomes\n")
     decision_step = _extract_step(manifest, "evaluate.model_selection")
     if decision_step and isinstance(decision_step.get("payload"), dict) and decision_step.get("payload"):
-        lines.append("### evaluate.model_selection.payload")
-        lines.append("```json")
-        lines.append(_as_pretty_json(decision_step.get("payload")))
-        lines.append("```")
+        w("### evaluate.model_selection.payload\n```json\n")
+        w(_as_pretty_json(decision_step.get("payload")))
+        w("\n```\n")
     else:
-        lines.append("No decision payload found for `evaluate.model_selection` in the Manifest.")
-    lines.append("")
+        w("No decision payload found for `evaluate.model_selection` in the Manifest.\n")
+    w("\n")
 
     # Metrics
-    lines.append("## Metrics")
+    w("## Metrics\n")
     metrics_step = _extract_step(manifest, "evaluate.metrics")
     metrics = metrics_step.get("metrics") if isinstance(metrics_step, dict) else None
     if isinstance(metrics, dict) and metrics:
         for k, v in _sorted_items(metrics):
-            lines.append(f"- **{k}**: `{v}`")
+            w(f"- **{k}**: `{v}`\n")
     else:
-        lines.append("No metrics found for `evaluate.metrics.metrics` in the Manifest.")
-    lines.append("")
+        w("No metrics found for `evaluate.metrics.metrics` in the Manifest.\n")
+    w("\n")
 
     # Generated Artifacts
-    lines.append("## Generated Artifacts")
-    artifacts = _collect_artifacts_from_steps(steps)
+    w("## Generated Artifacts\n")
+    artifacts = _collect_artifacts_from_steps(sorted_steps)
     if artifacts:
         for a in artifacts:
-            lines.append(
-                f"- **{a['artifact_key']}** — `{a['path']}` (produced_by: `{a['produced_by']}`)"
-            )
+            w(f"- **{a['artifact_key']}** — `{a['path']}` (produced_by: `{a['produced_by']}`)\n")
     else:
-        lines.append("No artifacts recorded in Manifest steps.")
-    lines.append("")
+        w("No artifacts recorded in Manifest steps.\n")
+    w("\n")
 
     # Traceability
-    lines.append("## Traceability")
-    lines.append("- Source of truth: `Manifest` (final) only.")
-    lines.append("- This report does not compute or infer missing information.")
-    lines.append(f"- Events recorded: `{len(events)}`\n" if isinstance(events, list) else "- Events recorded: `<unknown>`\n")
+    w("## Traceability\n")
+    w("- Source of truth: `Manifest` (final) only.\n")
+    w("- This report does not compute or infer missing information.\n")
+    w(f"- Events recorded: `{len(events)}`\n\n" if isinstance(events, list) else "- Events recorded: `<unknown>`\n\n")
 
     # Limitations
-    lines.append("## Limitations")
-    lines.append("- No PDF generation (out of scope v1).") 
-    lines.append("- No charts/visualizations (out of scope v1).") 
-    lines.append("- No interpretation or business commentary; this is a consolidation artifact.\n")
+    w("## Limitations\n")
+    w("- No PDF generation (out of scope v1).\n")
+    w("- No charts/visualizations (out of scope v1).\n")
+    w("- No interpretation or business commentary; this is a consolidation artifact.\n\n")
 
     # Execution Metadata
-    lines.append("## Execution Metadata")
-    lines.append("### run")
-    lines.append("```json")
-    lines.append(_as_pretty_json(run))
-    lines.append("```")
-    lines.append("### inputs")
-    lines.append("```json")
-    lines.append(_as_pretty_json(inputs))
-    lines.append("```")
-
-    content = "\n".join(lines)
+    w("## Execution Metadata\n")
+    w("### run\n```json\n")
+    w(_as_pretty_json(run))
+    w("\n```\n### inputs\n```json\n")
+    w(_as_pretty_json(inputs))
+    w("\n```")
+
+    content = buf.getvalue()
 
     # sanity: ensure required sections exist
     for sec in REQUIRED_SECTIONS:
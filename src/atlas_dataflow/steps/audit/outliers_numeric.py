@@ -48,6 +48,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    # pandas/numpy são exigidos em runtime por este Step; import opcional no
+    # módulo para não quebrar o import do pacote sem a stack científica.
+    import numpy as np  # type: ignore
+    import pandas as pd  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+    pd = None  # type: ignore
+
 from atlas_dataflow.core.pipeline.context import RunContext
 from atlas_dataflow.core.pipeline.step import Step
 from atlas_dataflow.core.pipeline.types import StepKind, StepResult, StepStatus
@@ -67,52 +76,31 @@ def _get_step_cfg(ctx: RunContext, step_id: str) -> Dict[str, Any]:
     return step_cfg if isinstance(step_cfg, dict) else {}
 
 
-def _is_numeric_dtype(series: Any) -> bool:
-    try:
-        import pandas as pd  # type: ignore
+def _numeric_columns(df: Any) -> List[Any]:
+    """Colunas numéricas auditáveis, selecionadas uma vez por DataFrame.
+
+    Boolean é numérico no pandas, mas a semântica é outra; timedelta entra em
+    "number" no `select_dtypes`, mas não é tratado como numérico aqui.
+    """
+    return list(df.select_dtypes(include="number", exclude=["bool", "boolean", "timedelta"]).columns)
 
-        return bool(pd.api.types.is_numeric_dtype(series))
-    except Exception:
-        return False
 
+def _float_values(series: Any) -> np.ndarray:
+    """Valores não-nulos da coluna como ndarray float64 (sem boxing por valor).
 
-def _safe_float(x: Any) -> Optional[float]:
-    if x is None:
-        return None
-    try:
-        # bool is subclass of int; outliers for bool are not meaningful here
-        if isinstance(x, bool):
-            return float(int(x))
-        return float(x)
-    except Exception:
-        return None
+    Colunas complexas não têm ordem/bounds reais: resultam em array vazio.
+    """
+    if pd.api.types.is_complex_dtype(series):
+        return np.empty(0, dtype=np.float64)
+    arr = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return arr[~np.isnan(arr)]
 
 
-def _iqr_bounds(values: List[float]) -> Tuple[Optional[float], Optional[float]]:
-    if len(values) < 2:
+def _iqr_bounds(values: np.ndarray) -> Tuple[Optional[float], Optional[float]]:
+    if values.size < 2:
         return (None, None)
 
-    try:
-        import numpy as np  # type: ignore
-    except Exception:
-        # Fallback sem numpy (muito improvável no projeto, mas mantém o core robusto)
-        values_sorted = sorted(values)
-        def _percentile(p: float) -> float:
-            k = (len(values_sorted) - 1) * p
-            f = int(k)
-            c = min(f + 1, len(values_sorted) - 1)
-            if f == c:
-                return float(values_sorted[f])
-            d0 = values_sorted[f] * (c - k)
-            d1 = values_sorted[c] * (k - f)
-            return float(d0 + d1)
-
-        q1 = _percentile(0.25)
-        q3 = _percentile(0.75)
-    else:
-        arr = np.array(values, dtype=float)
-        q1 = float(np.quantile(arr, 0.25))
-        q3 = float(np.quantile(arr, 0.75))
+    q1, q3 = (float(q) for q in np.quantile(values, (0.25, 0.75)))
 
     iqr = q3 - q1
     lower = q1 - 1.5 * iqr
@@ -120,20 +108,13 @@ def _iqr_bounds(values: List[float]) -> Tuple[Optional[float], Optional[float]]:
     return (float(lower), float(upper))
 
 
-def _zscore_bounds(values: List[float], threshold: float) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
+def _zscore_bounds(values: np.ndarray, threshold: float) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
     # Retorna: (mean, std, lower, upper) — bounds aproximados para zscore (mean ± threshold*std)
-    if len(values) < 2:
+    if values.size < 2:
         return (None, None, None, None)
-    try:
-        import numpy as np  # type: ignore
-    except Exception:
-        mean = sum(values) / float(len(values))
-        var = sum((v - mean) ** 2 for v in values) / float(len(values))
-        std = var ** 0.5
-    else:
-        arr = np.array(values, dtype=float)
-        mean = float(arr.mean())
-        std = float(arr.std(ddof=0))
+    with np.errstate(invalid="ignore"):
+        mean = float(values.mean())
+        std = float(values.std(ddof=0))
 
     if std == 0.0:
         return (float(mean), float(std), None, None)
@@ -143,41 +124,50 @@ def _zscore_bounds(values: List[float], threshold: float) -> Tuple[Optional[floa
     return (float(mean), float(std), float(lower), float(upper))
 
 
-def _count_outliers_iqr(series: Any, lower: Optional[float], upper: Optional[float]) -> int:
+def _count_outliers_iqr(values: np.ndarray, lower: Optional[float], upper: Optional[float]) -> int:
     if lower is None or upper is None:
         return 0
-    try:
-        mask = series.notna() & ((series < lower) | (series > upper))
-        return int(mask.sum())
-    except Exception:
-        # Fallback manual (mantém determinismo, mas pode ser mais lento)
-        cnt = 0
-        for v in list(series):
-            fv = _safe_float(v)
-            if fv is None:
-                continue
-            if fv < lower or fv > upper:
-                cnt += 1
-        return int(cnt)
-
-
-def _count_outliers_zscore(series: Any, mean: Optional[float], std: Optional[float], threshold: float) -> int:
+    return int(np.count_nonzero((values < lower) | (values > upper)))
+
+
+def _count_outliers_zscore(values: np.ndarray, mean: Optional[float], std: Optional[float], threshold: float) -> int:
     if mean is None or std is None or std == 0.0:
         return 0
-    try:
-        z = (series - mean) / std
-        mask = series.notna() & (z.abs() > threshold)
-        return int(mask.sum())
-    except Exception:
-        cnt = 0
-        for v in list(series):
-            fv = _safe_float(v)
-            if fv is None:
-                continue
-            z = (fv - mean) / std
-            if abs(z) > threshold:
-                cnt += 1
-        return int(cnt)
+    with np.errstate(invalid="ignore"):
+        z = np.abs((values - mean) / std)
+    return int(np.count_nonzero(z > threshold))
+
+
+def _outlier_records(values: np.ndarray, use_iqr: bool, use_z: bool, z_thr: float) -> List[Dict[str, Any]]:
+    """Registros iqr/zscore de uma coluna a partir de um único array de valores."""
+    non_null = int(values.size)
+    records: List[Dict[str, Any]] = []
+
+    if use_iqr:
+        lower, upper = _iqr_bounds(values)
+        cnt = _count_outliers_iqr(values, lower, upper)
+        records.append(
+            {
+                "method": "iqr",
+                "count": cnt,
+                "ratio": float(cnt / non_null) if non_null > 0 else 0.0,
+                "bounds": {"lower": lower, "upper": upper},
+            }
+        )
+
+    if use_z:
+        mean, std, lower, upper = _zscore_bounds(values, z_thr)
+        cnt = _count_outliers_zscore(values, mean, std, z_thr)
+        records.append(
+            {
+                "method": "zscore",
+                "count": cnt,
+                "ratio": float(cnt / non_null) if non_null > 0 else 0.0,
+                "bounds": {"lower": lower, "upper": upper},
+            }
+        )
+
+    return records
 
 
 @dataclass
@@ -246,86 +236,20 @@ class AuditOutliersNumericStep(Step):
                 if df is None:
                     raise ValueError(f"Artifact {art_key} is None")
 
-                try:
-                    import pandas as pd  # type: ignore
-                except Exception as e:
-                    raise RuntimeError("pandas is required for audit.outliers_numeric") from e
+                if pd is None:
+                    raise RuntimeError("pandas is required for audit.outliers_numeric")
 
                 if not isinstance(df, pd.DataFrame):
                     raise TypeError(f"Artifact {art_key} must be a pandas DataFrame")
 
-                for col in list(df.columns):
+                for col in _numeric_columns(df):
                     s = df[col]
-                    if not _is_numeric_dtype(s):
-                        continue
-
-                    # Evita tratar boolean como numérico aqui (é numérico no pandas, mas semântica é outra)
-                    try:
-                        if pd.api.types.is_bool_dtype(s):
-                            continue
-                    except Exception:
-                        pass
-
-                    non_null = int(s.notna().sum())
-                    if non_null == 0:
-                        # Sem dados: ainda assim emitimos registros determinísticos com count 0.
-                        if col not in outliers:
-                            outliers[col] = []
-                        if use_iqr:
-                            outliers[col].append(
-                                {
-                                    "method": "iqr",
-                                    "count": 0,
-                                    "ratio": 0.0,
-                                    "bounds": {"lower": None, "upper": None},
-                                }
-                            )
-                        if use_z:
-                            outliers[col].append(
-                                {
-                                    "method": "zscore",
-                                    "count": 0,
-                                    "ratio": 0.0,
-                                    "bounds": {"lower": None, "upper": None},
-                                }
-                            )
-                        continue
-
-                    # Extrai valores float para cálculo de bounds (determinístico)
-                    vals: List[float] = []
-                    for v in list(s.dropna().tolist()):
-                        fv = _safe_float(v)
-                        if fv is not None:
-                            vals.append(fv)
-
-                    if col not in outliers:
-                        outliers[col] = []
-
-                    if use_iqr:
-                        lower, upper = _iqr_bounds(vals)
-                        cnt = _count_outliers_iqr(s, lower, upper)
-                        ratio = (cnt / non_null) if non_null > 0 else 0.0
-                        outliers[col].append(
-                            {
-                                "method": "iqr",
-                                "count": int(cnt),
-                                "ratio": float(ratio),
-                                "bounds": {"lower": lower, "upper": upper},
-                            }
-                        )
-
-                    if use_z:
-                        mean, std, lower, upper = _zscore_bounds(vals, z_thr)
-                        cnt = _count_outliers_zscore(s, mean, std, z_thr)
-                        ratio = (cnt / non_null) if non_null > 0 else 0.0
-                        outliers[col].append(
-                            {
-                                "method": "zscore",
-                                "count": int(cnt),
-                                "ratio": float(ratio),
-                                "bounds": {"lower": lower, "upper": upper},
-                            }
-                        )
+
+                    # Uma conversão por coluna alimenta contagem de não-nulos,
+                    # bounds e contagens de ambos os métodos. Coluna sem dados
+                    # ainda gera registros determinísticos (count 0, bounds None).
+                    vals = _float_values(s)
+                    outliers.setdefault(col, []).extend(_outlier_records(vals, use_iqr, use_z, z_thr))
 
             # Ordenação determinística: colunas por nome; métodos iqr antes de zscore.
             ordered: Dict[str, List[Dict[str, Any]]] = {}
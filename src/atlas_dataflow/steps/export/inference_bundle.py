@@ -37,7 +37,7 @@ from atlas_dataflow.deployment.inference_bundle import (
     InferenceBundleV1,
     save_inference_bundle_v1,
 )
-from atlas_dataflow.persistence.preprocess_store import PreprocessStore
+from atlas_dataflow.persistence.preprocess_store import PreprocessStore, load_preprocess_artifact
 
 
 # ---------------------------------------------------------------------------
@@ -232,7 +232,7 @@ class ExportInferenceBundleStep(Step):
             )
 
         try:
-            preprocess_obj = joblib.load(str(preprocess_path))
+            preprocess_obj = load_preprocess_artifact(preprocess_path)
         except Exception as e:
             err = AtlasErrorPayload(
                 type="PREPROCESS_LOAD_FAILED",
@@ -243,7 +243,7 @@ class ExportInferenceBundleStep(Step):
                     "exception_message": str(e),
                     "step": self.id,
                 },
-                hint="Verifique se preprocess.joblib foi salvo corretamente (joblib.dump) e não está corrompido.",
+                hint="Verifique se preprocess.joblib foi salvo corretamente (PreprocessStore.save) e não está corrompido.",
                 decision_required=False,
             ).to_dict()
             return StepResult(
@@ -59,7 +59,7 @@ class ModelCardInputs:
     export_payload: Optional[Dict[str, Any]] = None
 
 
-_MIN_SECTIONS = [
+_MIN_SECTIONS = (
     "# Model Card",
     "## Model Overview",
     "## Training Data",
@@ -67,7 +67,7 @@ _MIN_SECTIONS = [
     "## Metrics",
     "## Limitations",
     "## Execution Metadata",
-]
+)
 
 
 def _require_dict(x: Any, name: str) -> Dict[str, Any]:
@@ -85,35 +85,33 @@ def _manifest_get(manifest: Dict[str, Any], *keys: str) -> Any:
     return cur
 
 
-def _pick_dataset_origin(manifest: Dict[str, Any]) -> str:
-    """Extrai a origem do dataset a partir do Manifest (sem heurística)."""
-    steps = _manifest_get(manifest, "steps")
-    if isinstance(steps, dict):
-        ingest = steps.get("ingest.load")
-        if isinstance(ingest, dict):
-            artifacts = ingest.get("artifacts")
-            if isinstance(artifacts, dict):
-                for k in (
-                    "source_path",  # usado nos testes
-                    "source",
-                    "path",
-                    "dataset_path",
-                    "input_path",
-                    "uri",
-                ):
-                    v = artifacts.get(k)
-                    if isinstance(v, str) and v.strip():
-                        return v.strip()
-            payload = ingest.get("payload")
-            if isinstance(payload, dict):
-                for k in ("source_path", "source", "path", "dataset_path", "input_path", "uri"):
-                    v = payload.get(k)
-                    if isinstance(v, str) and v.strip():
-                        return v.strip()
+def _pick_dataset_origin(ingest: Any) -> str:
+    """Extrai a origem do dataset do Step `ingest.load` do Manifest (sem heurística)."""
+    if isinstance(ingest, dict):
+        artifacts = ingest.get("artifacts")
+        if isinstance(artifacts, dict):
+            for k in (
+                "source_path",  # usado nos testes
+                "source",
+                "path",
+                "dataset_path",
+                "input_path",
+                "uri",
+            ):
+                v = artifacts.get(k)
+                if isinstance(v, str) and v.strip():
+                    return v.strip()
+        payload = ingest.get("payload")
+        if isinstance(payload, dict):
+            for k in ("source_path", "source", "path", "dataset_path", "input_path", "uri"):
+                v = payload.get(k)
+                if isinstance(v, str) and v.strip():
+                    return v.strip()
     return "unknown (não registrado no Manifest)"
 
-def _pick_bundle_info(inputs: ModelCardInputs) -> Dict[str, str]:
-    """Extrai infos do bundle via export_payload ou Manifest (sem inferência)."""
+
+def _pick_bundle_info(inputs: ModelCardInputs, exp: Any) -> Dict[str, str]:
+    """Extrai infos do bundle via export_payload ou Step `export.inference_bundle` (sem inferência)."""
     bundle_path = None
     bundle_sha256 = None
     bundle_version = None
@@ -144,57 +142,54 @@ def _pick_bundle_info(inputs: ModelCardInputs) -> Dict[str, str]:
             contract_version = p.get("contract_version")
 
     # 2) Fonte de verdade: manifest.steps["export.inference_bundle"]
-    steps = _manifest_get(inputs.manifest, "steps")
-    if isinstance(steps, dict):
-        exp = steps.get("export.inference_bundle")
-        if isinstance(exp, dict):
-            arts = exp.get("artifacts")
-            if isinstance(arts, dict):
-                if bundle_path is None and isinstance(arts.get("bundle_path"), str):
-                    bundle_path = arts.get("bundle_path")
-                if bundle_sha256 is None and isinstance(arts.get("bundle_hash"), str):
-                    bundle_sha256 = arts.get("bundle_hash")
-                if bundle_sha256 is None and isinstance(arts.get("bundle_sha256"), str):
-                    bundle_sha256 = arts.get("bundle_sha256")
-                if bundle_sha256 is None and isinstance(arts.get("sha256"), str):
-                    bundle_sha256 = arts.get("sha256")
-
-                if fmt is None and isinstance(arts.get("format"), str):
-                    fmt = arts.get("format")
-                if bundle_version is None and isinstance(arts.get("bundle_version"), str):
-                    bundle_version = arts.get("bundle_version")
-
-                if champion_model_id is None and isinstance(arts.get("champion_model_id"), str):
-                    champion_model_id = arts.get("champion_model_id")
-                if champion_model_id is None and isinstance(arts.get("model_id"), str):
-                    champion_model_id = arts.get("model_id")
-
-                if contract_version is None and isinstance(arts.get("contract_version"), str):
-                    contract_version = arts.get("contract_version")
-
-            payload = exp.get("payload")
-            if isinstance(payload, dict):
-                if bundle_path is None and isinstance(payload.get("bundle_path"), str):
-                    bundle_path = payload.get("bundle_path")
-                if bundle_sha256 is None and isinstance(payload.get("bundle_hash"), str):
-                    bundle_sha256 = payload.get("bundle_hash")
-                if bundle_sha256 is None and isinstance(payload.get("bundle_sha256"), str):
-                    bundle_sha256 = payload.get("bundle_sha256")
-                if bundle_sha256 is None and isinstance(payload.get("sha256"), str):
-                    bundle_sha256 = payload.get("sha256")
-
-                if fmt is None and isinstance(payload.get("format"), str):
-                    fmt = payload.get("format")
-                if bundle_version is None and isinstance(payload.get("bundle_version"), str):
-                    bundle_version = payload.get("bundle_version")
-
-                if champion_model_id is None and isinstance(payload.get("champion_model_id"), str):
-                    champion_model_id = payload.get("champion_model_id")
-                if champion_model_id is None and isinstance(payload.get("model_id"), str):
-                    champion_model_id = payload.get("model_id")
-
-                if contract_version is None and isinstance(payload.get("contract_version"), str):
-                    contract_version = payload.get("contract_version")
+    if isinstance(exp, dict):
+        arts = exp.get("artifacts")
+        if isinstance(arts, dict):
+            if bundle_path is None and isinstance(arts.get("bundle_path"), str):
+                bundle_path = arts.get("bundle_path")
+            if bundle_sha256 is None and isinstance(arts.get("bundle_hash"), str):
+                bundle_sha256 = arts.get("bundle_hash")
+            if bundle_sha256 is None and isinstance(arts.get("bundle_sha256"), str):
+                bundle_sha256 = arts.get("bundle_sha256")
+            if bundle_sha256 is None and isinstance(arts.get("sha256"), str):
+                bundle_sha256 = arts.get("sha256")
+
+            if fmt is None and isinstance(arts.get("format"), str):
+                fmt = arts.get("format")
+            if bundle_version is None and isinstance(arts.get("bundle_version"), str):
+                bundle_version = arts.get("bundle_version")
+
+            if champion_model_id is None and isinstance(arts.get("champion_model_id"), str):
+                champion_model_id = arts.get("champion_model_id")
+            if champion_model_id is None and isinstance(arts.get("model_id"), str):
+                champion_model_id = arts.get("model_id")
+
+            if contract_version is None and isinstance(arts.get("contract_version"), str):
+                contract_version = arts.get("contract_version")
+
+        payload = exp.get("payload")
+        if isinstance(payload, dict):
+            if bundle_path is None and isinstance(payload.get("bundle_path"), str):
+                bundle_path = payload.get("bundle_path")
+            if bundle_sha256 is None and isinstance(payload.get("bundle_hash"), str):
+                bundle_sha256 = payload.get("bundle_hash")
+            if bundle_sha256 is None and isinstance(payload.get("bundle_sha256"), str):
+                bundle_sha256 = payload.get("bundle_sha256")
+            if bundle_sha256 is None and isinstance(payload.get("sha256"), str):
+                bundle_sha256 = payload.get("sha256")
+
+            if fmt is None and isinstance(payload.get("format"), str):
+                fmt = payload.get("format")
+            if bundle_version is None and isinstance(payload.get("bundle_version"), str):
+                bundle_version = payload.get("bundle_version")
+
+            if champion_model_id is None and isinstance(payload.get("champion_model_id"), str):
+                champion_model_id = payload.get("champion_model_id")
+            if champion_model_id is None and isinstance(payload.get("model_id"), str):
+                champion_model_id = payload.get("model_id")
+
+            if contract_version is None and isinstance(payload.get("contract_version"), str):
+                contract_version = payload.get("contract_version")
 
     return {
         "bundle_path": str(bundle_path or "unknown"),
@@ -207,20 +202,16 @@ def _pick_bundle_info(inputs: ModelCardInputs) -> Dict[str, str]:
 
 
 
-def generate_model_card_md(inputs: ModelCardInputs) -> str:
-    manifest = _require_dict(inputs.manifest, "manifest")
-    contract = _require_dict(inputs.contract, "contract")
-    metrics = _require_dict(inputs.champion_metrics, "champion_metrics")
-
-    if not manifest:
-        raise ModelCardError("Manifest ausente ou vazio (fonte de verdade obrigatória)")
-    if not contract:
-        raise ModelCardError("Contrato ausente ou vazio (fonte de verdade obrigatória)")
-    if not metrics:
-        raise ModelCardError("Métricas ausentes ou vazias (fonte de verdade obrigatória)")
+def _extract_manifest_facts(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extrai, em uma única passada, os fatos do Manifest usados pelo Model Card.
 
-    dataset_origin = _pick_dataset_origin(manifest)
-    bundle = _pick_bundle_info(inputs)
+    Retorna um namespace plano: `dataset_origin`, `export_step` (dict do Step
+    `export.inference_bundle`, se houver), `run_id` e `created_at`.
+    """
+    steps = manifest.get("steps")
+    if not isinstance(steps, dict):
+        steps = {}
 
     # suportar diferentes formas de manifest mínimo nos testes
     run_id = (
@@ -239,6 +230,24 @@ def generate_model_card_md(inputs: ModelCardInputs) -> str:
         or "unknown"
     )
 
+    return {
+        "dataset_origin": _pick_dataset_origin(steps.get("ingest.load")),
+        "export_step": steps.get("export.inference_bundle"),
+        "run_id": run_id,
+        "created_at": created_at,
+    }
+
+
+def _render_card_body(
+    *,
+    contract: Dict[str, Any],
+    metrics: Dict[str, Any],
+    bundle: Dict[str, str],
+    dataset_origin: str,
+    run_id: Any,
+    created_at: Any,
+) -> str:
+    """Renderiza o Model Card até `created_at` (parte determinística do card)."""
     # contrato de entrada (features e tipos)
     features = contract.get("features")
     feature_lines = []
@@ -260,8 +269,7 @@ def generate_model_card_md(inputs: ModelCardInputs) -> str:
     if not metric_lines:
         metric_lines.append("- (métricas não registradas)")
 
-    lines = []
-    lines.extend(_MIN_SECTIONS)
+    lines = list(_MIN_SECTIONS)
     lines.append("")
 
     # Overview — manter rótulos esperados pelos testes
@@ -298,17 +306,41 @@ def generate_model_card_md(inputs: ModelCardInputs) -> str:
     lines.append("## Execution Metadata")
     lines.append(f"- run_id: `{run_id}`")
     lines.append(f"- created_at: `{created_at}`")
-    lines.append(f"- generated_at_utc: `{datetime.now(timezone.utc).isoformat()}`")
-    lines.append("")
+    return "\n".join(lines)
+
+
+def generate_model_card_md(inputs: ModelCardInputs) -> str:
+    manifest = _require_dict(inputs.manifest, "manifest")
+    contract = _require_dict(inputs.contract, "contract")
+    metrics = _require_dict(inputs.champion_metrics, "champion_metrics")
 
-    return "\n".join(lines).strip() + "\n"
+    if not manifest:
+        raise ModelCardError("Manifest ausente ou vazio (fonte de verdade obrigatória)")
+    if not contract:
+        raise ModelCardError("Contrato ausente ou vazio (fonte de verdade obrigatória)")
+    if not metrics:
+        raise ModelCardError("Métricas ausentes ou vazias (fonte de verdade obrigatória)")
+
+    # Derivado a cada chamada: manifest/contract/metrics são dicts mutáveis
+    facts = _extract_manifest_facts(manifest)
+    bundle = _pick_bundle_info(inputs, facts["export_step"])
+    body = _render_card_body(
+        contract=contract,
+        metrics=metrics,
+        bundle=bundle,
+        dataset_origin=facts["dataset_origin"],
+        run_id=facts["run_id"],
+        created_at=facts["created_at"],
+    )
+    return f"{body}\n- generated_at_utc: `{datetime.now(timezone.utc).isoformat()}`\n"
 
 
 def save_model_card_md(*, inputs: ModelCardInputs, path: Path) -> Dict[str, Any]:
     md = generate_model_card_md(inputs)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(md, encoding="utf-8")
-    return {"path": str(path), "bytes": len(md.encode("utf-8"))}
+    data = md.encode("utf-8")
+    path.write_bytes(data)
+    return {"path": str(path), "bytes": len(data)}
 
 
 
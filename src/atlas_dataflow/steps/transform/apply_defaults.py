@@ -181,13 +181,9 @@ class TransformApplyDefaultsStep(Step):
         # Atualiza dataset no contexto
         ctx.dataset = df
 
-        return StepResult(
+        return StepResult.ok(
             step_id=self.step_id,
             kind=StepKind.TRANSFORM,
             status=StepStatus.SUCCESS,
             summary="defaults applied (contract-driven)",
-            metrics={},
-            warnings=[],
-            artifacts={},
-            payload={},
         )
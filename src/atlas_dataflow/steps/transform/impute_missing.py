@@ -285,8 +285,7 @@ class TransformImputeMissingStep(Step):
             }
 
             # warnings explícitos no StepResult e no ctx
-            for w in warnings:
-                ctx.add_warning(step_id=self.id, message=w)
+            ctx.add_warnings(step_id=self.id, messages=warnings)
 
             ctx.log(
                 step_id=self.id,
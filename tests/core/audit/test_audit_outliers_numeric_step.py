@@ -111,3 +111,27 @@ def test_ignores_non_numeric_columns(dummy_ctx):
     assert result.payload["outliers"] == {}
 
     pd.testing.assert_frame_equal(df, df_before)
+
+
+def test_numeric_column_selection_by_dtype(dummy_ctx):
+    df = pd.DataFrame(
+        {
+            "x": pd.array([1, 2, 3, 4, None, 100], dtype="Int64"),
+            "flag": pd.array([True, None, False, True, True, False], dtype="boolean"),
+            "b": [True, False, True, True, False, False],
+            "td": pd.to_timedelta([1, 2, 3, 4, 5, 6], unit="s"),
+            "z": [1 + 1j, 2, 3, 4, 5, 6],
+        }
+    )
+    ctx = dummy_ctx
+    ctx.set_artifact("data.raw_rows", df)
+    _set_step_cfg(ctx, {"enabled": True, "methods": {"iqr": True, "zscore": False}})
+
+    result = AuditOutliersNumericStep().run(ctx)
+
+    assert result.status.name == "SUCCESS"
+    out = result.payload["outliers"]
+    assert set(out) == {"x", "z"}
+    assert out["x"][0]["count"] == 1
+    assert out["x"][0]["ratio"] == pytest.approx(1 / 5)
+    assert out["z"] == [{"method": "iqr", "count": 0, "ratio": 0.0, "bounds": {"lower": None, "upper": None}}]
@@ -197,4 +197,17 @@ def test_export_inference_bundle_invalid_payload_fails(tmp_path: Path):
 
     # dtype incompatível (bool no lugar de float)
     with pytest.raises(ValueError):
-        bundle.predict({"x": True, "category": "A"})
\ No newline at end of file
+        bundle.predict({"x": True, "category": "A"})
+
+def test_save_inference_bundle_hash_matches_file(tmp_path: Path):
+    import hashlib
+
+    from atlas_dataflow.deployment.inference_bundle import InferenceBundleV1, save_inference_bundle_v1
+
+    contract, _, model = _fit_preprocess_and_model(tmp_path)
+    bundle = InferenceBundleV1(preprocess=None, model=model, contract=contract, metrics={}, metadata={})
+    meta = save_inference_bundle_v1(bundle=bundle, path=tmp_path / "b.joblib")
+
+    expected = hashlib.sha256((tmp_path / "b.joblib").read_bytes()).hexdigest()
+    assert meta["bundle_hash"] == expected
+    assert load_inference_bundle(path=tmp_path / "b.joblib").contract == contract
@@ -240,3 +240,28 @@ def test_export_model_card_fails_explicitly_when_manifest_missing(tmp_path: Path
 
     sr = ExportModelCardStep().run(ctx)
     assert sr.status == StepStatus.FAILED
+
+
+def test_model_card_reflects_mutated_inputs():
+    from atlas_dataflow.steps.export.model_card import ModelCardInputs, generate_model_card_md
+
+    manifest = _mk_manifest_with_minimum_steps()
+    step_started(manifest, step_id="ingest.load", ts=datetime(2025, 1, 1, tzinfo=timezone.utc), kind="ingest")
+    step_finished(
+        manifest,
+        step_id="ingest.load",
+        ts=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        result={"status": "success", "artifacts": {"source_path": "/data/a.csv"}},
+    )
+    metrics = {"f1": 0.5}
+    inputs = ModelCardInputs(manifest=manifest, contract=_minimal_contract_v1(), champion_metrics=metrics)
+
+    first = generate_model_card_md(inputs)
+    assert "/data/a.csv" in first and "0.5" in first
+
+    # Entradas são dicts mutáveis: o card regenerado não pode ficar defasado
+    metrics["f1"] = 0.9
+    manifest["steps"]["ingest.load"]["artifacts"]["source_path"] = "/data/b.csv"
+    second = generate_model_card_md(inputs)
+    assert "/data/b.csv" in second and "0.9" in second
+    assert "/data/a.csv" not in second
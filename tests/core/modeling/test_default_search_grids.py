@@ -63,3 +63,27 @@ def test_to_dict_is_serializable_structure():
     assert isinstance(d["param_grid"], dict)
     assert isinstance(d["cv"], dict)
     assert d["version"] == "v1"
+
+
+def test_default_v1_does_not_share_mutable_state():
+    grids = DefaultSearchGrids.v1()
+    grids.get("knn").param_grid["n_neighbors"].append(99)
+    assert 99 not in DefaultSearchGrids.v1().get("knn").param_grid["n_neighbors"]
+
+    mr = ModelRegistry.v1()
+    mr.get("knn").default_params["leaf_size"] = 1
+    assert "leaf_size" not in ModelRegistry.v1().get("knn").default_params
+
+
+def test_grid_param_missing_from_estimator_fails():
+    from sklearn.linear_model import LogisticRegression
+
+    from atlas_dataflow.modeling.model_registry import ModelSpec
+
+    base = ModelRegistry.v1()
+    mr = ModelRegistry(
+        specs=[base.get("logistic_regression"), base.get("random_forest")]
+        + [ModelSpec(model_id="knn", estimator_cls=LogisticRegression)]
+    )
+    with pytest.raises(ValueError, match="n_neighbors"):
+        DefaultSearchGrids.v1(model_registry=mr)
@@ -75,7 +75,7 @@ def test_preprocess_persist_and_round_trip_transform_is_identical(tmp_path):
 
     # metadata registrada
     assert meta["type"] == "preprocess"
-    assert meta["format"] == "joblib"
+    assert meta["format"] == "pickle"
     assert meta["path"] == "artifacts/preprocess.joblib"
     assert meta["builder"] == "representation.preprocess"
     assert meta["version"] == "v1"
@@ -99,3 +99,64 @@ def test_preprocess_load_fails_when_artifact_missing(tmp_path):
     store = PreprocessStore(run_dir=tmp_path)
     with pytest.raises(FileNotFoundError):
         _ = store.load()
+
+
+@pytest.mark.parametrize("serializer", ["pickle", "joblib"])
+def test_preprocess_round_trip_for_each_serializer(tmp_path, serializer):
+    import joblib
+
+    df = _dataset()
+    pre = build_representation_preprocess(contract=_contract_minimal(), config=_config_minimal())
+    pre.fit(df)
+
+    store = PreprocessStore(run_dir=tmp_path)
+    meta = store.save(preprocess=pre, serializer=serializer)
+
+    assert meta["format"] == serializer
+    assert np.allclose(store.load().transform(df), pre.transform(df))
+    # artefato continua legível por joblib.load (export.inference_bundle)
+    assert np.allclose(joblib.load(store.artifact_path()).transform(df), pre.transform(df))
+
+
+def test_compressed_preprocess_round_trip(tmp_path):
+    from atlas_dataflow.persistence import preprocess_store as ps
+
+    df = _dataset()
+    pre = build_representation_preprocess(contract=_contract_minimal(), config=_config_minimal())
+    pre.fit(df)
+    store = PreprocessStore(run_dir=tmp_path)
+
+    if ps.zstandard is None:
+        with pytest.raises(RuntimeError, match="zstandard"):
+            store.save(preprocess=pre, compress=True)
+        return
+
+    meta = store.save(preprocess=pre, compress=True)
+    assert meta["format"] == "pickle+zstd"
+    assert store.artifact_path().read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+    assert np.allclose(store.load().transform(df), pre.transform(df))
+
+
+def test_buffered_events_are_flushed_once(tmp_path):
+    df = _dataset()
+    pre = build_representation_preprocess(contract=_contract_minimal(), config=_config_minimal())
+    pre.fit(df)
+    manifest = create_manifest(
+        run_id="r2",
+        started_at=datetime.now(timezone.utc),
+        atlas_version="0.0",
+        config_hash="",
+        contract_hash="",
+    )
+
+    store = PreprocessStore(run_dir=tmp_path)
+    buffer: list = []
+    store.save(preprocess=pre, manifest=manifest, event_buffer=buffer)
+    store.save(preprocess=pre, manifest=manifest, event_buffer=buffer)
+    assert not [e for e in manifest.events if e.get("event_type") == "artifact_saved"]
+
+    PreprocessStore.flush_events(manifest, buffer)
+    ev = [e for e in manifest.events if e.get("event_type") == "artifact_saved"]
+    assert len(ev) == 2
+    assert ev[0]["payload"]["artifact"]["path"] == "artifacts/preprocess.joblib"
+    assert buffer == []
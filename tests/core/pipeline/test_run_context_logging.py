@@ -151,3 +151,61 @@ def test_warning_collection(dummy_ctx):
     dummy_ctx.add_warning(step_id="audit.schema", message="missing column")
     assert "audit.schema" in dummy_ctx.warnings
     assert dummy_ctx.warnings["audit.schema"] == ["missing column"]
+
+
+def test_warning_batch_collection(dummy_ctx):
+    """
+    Verifica que `add_warnings` equivale a `add_warning` aplicado em sequência.
+
+    Invariantes:
+        - A ordem das mensagens é preservada
+        - Warnings já existentes do Step são mantidos
+        - Uma coleção vazia não cria entrada para o Step
+    """
+    _require_imports()
+    dummy_ctx.add_warning(step_id="audit.schema", message="first")
+    dummy_ctx.add_warnings(step_id="audit.schema", messages=(m for m in ["second", "third"]))
+    dummy_ctx.add_warnings(step_id="audit.empty", messages=[])
+    assert dummy_ctx.warnings["audit.schema"] == ["first", "second", "third"]
+    assert "audit.empty" not in dummy_ctx.warnings
+
+
+def test_log_event_timestamp_is_iso_utc(dummy_ctx):
+    """
+    Verifica que eventos guardam `timestamp` em ISO 8601 com timezone UTC.
+    """
+    _require_imports()
+    from datetime import datetime
+
+    dummy_ctx.log(step_id="ingest.load", level="INFO", message="hello")
+    ts = dummy_ctx.events[-1]["timestamp"]
+    assert ts.endswith("+00:00")
+    assert datetime.fromisoformat(ts).utcoffset().total_seconds() == 0
+
+
+def test_non_str_step_id_is_accepted(dummy_ctx):
+    """
+    Verifica que `step_id` não-str (ex.: None em logs do Engine) segue aceito.
+
+    Invariantes:
+        - `sys.intern` só é aplicado a `str`; outros valores são mantidos
+    """
+    _require_imports()
+    dummy_ctx.log(step_id=None, level="INFO", message="engine")
+    dummy_ctx.add_warning(step_id=None, message="w")
+    dummy_ctx.add_warnings(step_id=None, messages=["w2"])
+    assert dummy_ctx.events[-1]["step_id"] is None
+    assert dummy_ctx.warnings[None] == ["w", "w2"]
+
+
+def test_events_is_a_plain_list(dummy_ctx):
+    """
+    Verifica que `events` segue uma lista (fatiável e serializável com `json`).
+    """
+    _require_imports()
+    import json
+
+    for i in range(3):
+        dummy_ctx.log(step_id="ingest.load", level="INFO", message=f"m{i}")
+    assert [e["message"] for e in dummy_ctx.events[-2:]] == ["m1", "m2"]
+    assert len(json.loads(json.dumps(dummy_ctx.events))) == len(dummy_ctx.events)
@@ -118,3 +118,50 @@ def test_dummy_step_satisfies_protocol(DummyStep, dummy_ctx):
     result = step.run(dummy_ctx)
     assert isinstance(result, StepResult)
     assert result.step_id == "ingest.load"
+
+
+def test_step_result_defaults_are_serializable():
+    """
+    Verifica que os defaults do StepResult permanecem vazios e serializáveis.
+
+    Invariantes:
+        - `warnings` default é uma sequência vazia compartilhada (sem alocação)
+        - Coleções default são serializáveis em JSON
+    """
+    import json
+
+    _require_imports()
+    a = StepResult(step_id="a", kind=StepKind.DIAGNOSTIC, status="success", summary="ok")
+    b = StepResult(step_id="b", kind=StepKind.DIAGNOSTIC, status="success", summary="ok")
+    assert len(a.warnings) == 0
+    assert a.warnings is b.warnings
+    json.dumps({"warnings": a.warnings, "metrics": a.metrics, "artifacts": a.artifacts, "payload": a.payload})
+
+
+def test_step_enums_keep_textual_values():
+    """
+    Verifica que StepKind/StepStatus permanecem enums textuais.
+
+    Invariantes:
+        - Valores serializam como texto canônico em JSON
+        - Membros são intercambiáveis com suas strings em comparação e hash
+    """
+    import json
+
+    _require_imports()
+    from atlas_dataflow.core.pipeline.types import StepStatus
+
+    assert json.dumps([StepKind.TRAIN, StepStatus.SUCCESS]) == '["train", "success"]'
+    assert StepStatus.FAILED == "failed"
+    assert {StepStatus.SKIPPED: 1}["skipped"] == 1
+
+
+def test_step_result_ok_matches_generic_constructor():
+    """
+    Verifica que `StepResult.ok` produz o mesmo resultado que o construtor genérico.
+    """
+    _require_imports()
+    from atlas_dataflow.core.pipeline.types import StepStatus
+
+    kwargs = dict(step_id="a", kind=StepKind.DIAGNOSTIC, status=StepStatus.SUCCESS, summary="ok")
+    assert StepResult.ok(**kwargs) == StepResult(**kwargs)
@@ -151,3 +151,24 @@ def test_all_required_sections_present(tmp_path: Path) -> None:
     ]
     for section in required_sections:
         assert section in content
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"b": [1, 2.5, None, True], "a": {"ç": "ü", "z": {}}, "e": []},
+        {"by_fold": {10: "a", 2: "b"}},
+        {"x": float("nan"), "y": 1e16, "z": 1e-7},
+        {"big": 10**20},
+    ],
+)
+def test_pretty_json_is_independent_of_orjson(monkeypatch, value) -> None:
+    import json
+
+    from atlas_dataflow.core.traceability import manifest as manifest_mod
+    from atlas_dataflow.report.report_md import _as_pretty_json
+
+    expected = json.dumps(value, ensure_ascii=False, sort_keys=True, indent=2)
+    assert _as_pretty_json(value) == expected
+    monkeypatch.setattr(manifest_mod, "orjson", None)
+    assert _as_pretty_json(value) == expected
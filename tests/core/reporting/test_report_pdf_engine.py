@@ -0,0 +1,149 @@
+"""
+tests/core/reporting/test_report_pdf_engine.py
+
+Cobertura — camada de conversao MD -> PDF (engine "simple"):
+- Cache de parse invalidado quando report.md muda
+- Engine "mistune" ponta a ponta (pulado sem o extra `pdf`)
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from atlas_dataflow.export.report_pdf import _load_normalized, _md_cache_key, convert_md_to_pdf
+
+
+def test_parse_cache_detects_edits(tmp_path: Path) -> None:
+    md = tmp_path / "report.md"
+    md.write_text("# Title\nbody\n", encoding="utf-8")
+    first = _load_normalized(*_md_cache_key(md))
+    assert first == ((1, "Title"), (0, "body"))
+    assert _load_normalized(*_md_cache_key(md)) is first
+
+    md.write_text("# Title\nchanged body\n", encoding="utf-8")
+    st = md.stat()
+    os.utime(md, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert _load_normalized(*_md_cache_key(md)) == ((1, "Title"), (0, "changed body"))
+
+    pdf = tmp_path / "report.pdf"
+    convert_md_to_pdf(md_path=md, pdf_path=pdf, engine_name="simple")
+    assert pdf.read_bytes().startswith(b"%PDF-1.4")
+
+
+def test_read_md_lines_handles_line_endings(tmp_path: Path) -> None:
+    from atlas_dataflow.export.report_pdf import _read_md_lines
+
+    md = tmp_path / "report.md"
+    md.write_bytes(b"# A\r\nfirst\rsecond\nFin")
+    assert _read_md_lines(md) == ["# A", "first", "second", "Fin"]
+
+
+def test_simple_pdf_xref_offsets_point_to_objects(tmp_path: Path) -> None:
+    md = tmp_path / "report.md"
+    md.write_text("# Execution Report\n\n- item (1)\n", encoding="utf-8")
+    pdf = tmp_path / "report.pdf"
+    convert_md_to_pdf(md_path=md, pdf_path=pdf, engine_name="simple")
+
+    data = pdf.read_bytes()
+    assert data.endswith(b"%%EOF\n")
+    xref_start = int(data.rsplit(b"startxref\n", 1)[1].split(b"\n", 1)[0])
+    entries = data[xref_start:].split(b"\n")[3:8]
+    for n, entry in enumerate(entries, start=1):
+        off = int(entry[:10])
+        assert data[off:].startswith(b"%d 0 obj\n" % n)
+
+
+def test_escape_pdf_text() -> None:
+    from atlas_dataflow.export.report_pdf import _escape_pdf_text
+
+    assert _escape_pdf_text("a\\b (c)") == "a\\\\b \\(c\\)"
+
+
+def test_normalize_md_to_plain_levels() -> None:
+    from atlas_dataflow.export.report_pdf import _normalize_md_to_plain
+
+    lines = ["# H1", "## H2 ", "###  H3", "#### H4", "- a", "* b", "#", "-x", "", "text"]
+    assert _normalize_md_to_plain(lines) == [
+        (1, "H1"),
+        (2, "H2"),
+        (3, "H3"),
+        (0, "#### H4"),
+        (0, "• a"),
+        (0, "• b"),
+        (0, "#"),
+        (0, "-x"),
+        (0, ""),
+        (0, "text"),
+    ]
+
+
+def test_simple_pdf_content_stream_ops(tmp_path: Path) -> None:
+    md = tmp_path / "report.md"
+    md.write_text("# Title\n\nbody (x)\n", encoding="utf-8")
+    pdf = tmp_path / "report.pdf"
+    convert_md_to_pdf(md_path=md, pdf_path=pdf, engine_name="simple")
+
+    stream = pdf.read_bytes().split(b"stream\n", 1)[1].split(b"\nendstream", 1)[0]
+    ops = stream.split(b"\n")
+    assert ops[0] == b"BT" and ops[-1] == b"ET"
+    assert ops[1:4] == [b"/F1 11 Tf", b"14 TL", b"50 796 Td"]
+    assert ops[4:] == [b"/F1 16 Tf", b"(Title) '", b"T*", b"/F1 11 Tf", b"(body \\(x\\)) '", b"ET"]
+
+
+def test_simple_pdf_emits_font_only_on_change(tmp_path: Path) -> None:
+    md = tmp_path / "report.md"
+    md.write_text("# Title\nline 1\nline 2\nline 3\n## Sub\nline 4\n", encoding="utf-8")
+    pdf = tmp_path / "report.pdf"
+    convert_md_to_pdf(md_path=md, pdf_path=pdf, engine_name="simple")
+
+    stream = pdf.read_bytes().split(b"stream\n", 1)[1].split(b"\nendstream", 1)[0]
+    fonts = [op for op in stream.split(b"\n") if op.endswith(b" Tf")]
+    assert fonts == [b"/F1 11 Tf", b"/F1 16 Tf", b"/F1 11 Tf", b"/F1 14 Tf", b"/F1 11 Tf"]
+
+
+def test_inline_text_flattens_mistune_tokens() -> None:
+    from atlas_dataflow.export.report_pdf import _inline_text
+
+    children = [
+        {"type": "text", "raw": "a "},
+        {"type": "strong", "children": [{"type": "text", "raw": "b"}]},
+        {"type": "softbreak"},
+        {"type": "codespan", "raw": "c"},
+    ]
+    assert _inline_text(children) == "a b c"
+
+
+def test_mistune_engine_converts_end_to_end(tmp_path: Path) -> None:
+    pytest.importorskip("mistune", minversion="3")
+    platypus = pytest.importorskip("reportlab.platypus")
+    from atlas_dataflow.export.report_pdf import get_engine
+
+    md = tmp_path / "report.md"
+    md.write_text(
+        "# Report\n\n- a\n  - nested\n- b\n\n1. first\n\n```json\n{\n  \"x\": 1\n}\n```\n\ntext & <tags>\n",
+        encoding="utf-8",
+    )
+    engine = get_engine("mistune")
+
+    # Estrutura de blocos preservada (código e listas aninhadas)
+    story = engine._build_story(md.read_text(encoding="utf-8"))
+    code = [f for f in story if isinstance(f, platypus.Preformatted)]
+    assert len(code) == 1 and code[0].lines == ["{", '  "x": 1', "}"]
+    lists = [f for f in story if isinstance(f, platypus.ListFlowable)]
+    assert len(lists) == 2
+    assert any(isinstance(f, platypus.ListFlowable) for f in lists[0]._flowables[0]._flowables)
+
+    pdf = tmp_path / "report.pdf"
+    convert_md_to_pdf(md_path=md, pdf_path=pdf, engine_name="mistune")
+    assert pdf.read_bytes().startswith(b"%PDF")
+
+
+def test_invalid_utf8_report_is_rejected(tmp_path: Path) -> None:
+    md = tmp_path / "report.md"
+    md.write_bytes(b"# Title\n\xff\xfe broken\n")
+
+    with pytest.raises(UnicodeDecodeError):
+        convert_md_to_pdf(md_path=md, pdf_path=tmp_path / "report.pdf", engine_name="simple")
@@ -33,6 +33,7 @@ Este módulo existe para garantir rastreabilidade forense explícita,
 ordenada e determinística dos eventos de execução.
 """
 
+import json
 import pytest
 from datetime import datetime, timezone
 
@@ -134,3 +135,167 @@ def test_event_log_appends_ordered_events():
     assert data["events"][0]["event_type"] == "run_started"
     assert data["events"][1]["event_type"] == "step_started"
     assert data["events"][1]["step_id"] == "a"
+
+
+def test_event_log_mutates_dict_manifest_in_place():
+    """
+    Verifica que Manifests em formato dict são atualizados in-place.
+
+    Invariantes:
+        - A lista `events` original recebe o evento (sem reconstrução)
+        - Seções ausentes são criadas vazias
+    """
+    _require_imports()
+    data = create_manifest(
+        run_id="run-005",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+    ).to_dict()
+    events = data["events"]
+    add_event(data, event_type="run_started", ts=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc))
+    assert data["events"] is events
+    assert events[0]["event_type"] == "run_started"
+
+    bare = {"run": {}, "inputs": {}}
+    add_event(bare, event_type="run_started", ts=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc))
+    assert len(bare["events"]) == 1 and bare["steps"] == {}
+
+
+def test_event_log_segments_round_trip(tmp_path):
+    """
+    Verifica o Event Log segmentado (`events_sink`) e sua reconstrução.
+
+    Invariantes:
+        - Ao atingir `flush_threshold`, eventos vão para o sink em JSON-Lines
+        - Em memória permanece apenas a cauda
+        - `load_manifest` recompõe o log completo, na ordem original
+    """
+    _require_imports()
+    from atlas_dataflow.core.traceability.manifest import load_manifest, save_manifest
+
+    sink = tmp_path / "events.jsonl"
+    m = create_manifest(
+        run_id="run-006",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+        events_sink=sink,
+        flush_threshold=2,
+    )
+    ts = datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc)
+    for i in range(5):
+        add_event(m, event_type="step_started", ts=ts, step_id=f"s{i}")
+
+    assert [e["step_id"] for e in m.events] == ["s4"]
+    assert len(sink.read_text(encoding="utf-8").splitlines()) == 4
+    assert m.to_dict()["events_segment"] == {"path": str(sink), "count": 4}
+
+    path = tmp_path / "manifest.json"
+    save_manifest(m, path)
+    loaded = load_manifest(path)
+    assert [e["step_id"] for e in loaded.events] == [f"s{i}" for i in range(5)]
+
+    # Gravado relativo ao manifest.json: o par pode ser movido junto
+    assert json.loads(path.read_bytes())["events_segment"]["path"] == "events.jsonl"
+    moved = tmp_path / "moved"
+    moved.mkdir()
+    path.rename(moved / "manifest.json")
+    sink.rename(moved / "events.jsonl")
+    loaded = load_manifest(moved / "manifest.json")
+    assert [e["step_id"] for e in loaded.events] == [f"s{i}" for i in range(5)]
+
+
+def test_async_writer_persists_latest_snapshot(tmp_path):
+    """
+    Verifica que o `AsyncManifestWriter` grava o snapshot mais recente.
+
+    Invariantes:
+        - O conteúdo gravado é idêntico ao de `save_manifest`
+        - Mutações após `submit` não afetam o snapshot enfileirado
+    """
+    _require_imports()
+    from atlas_dataflow.core.traceability.manifest import AsyncManifestWriter, save_manifest
+
+    m = create_manifest(
+        run_id="run-007",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+    )
+    ts = datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc)
+    add_event(m, event_type="run_started", ts=ts)
+
+    writer = AsyncManifestWriter(maxsize=2)
+    writer.submit(m, tmp_path / "async.json")
+    save_manifest(m, tmp_path / "sync.json")
+    add_event(m, event_type="step_started", ts=ts, step_id="a")
+    writer.close()
+
+    assert (tmp_path / "async.json").read_bytes() == (tmp_path / "sync.json").read_bytes()
+    assert not (tmp_path / "async.json.tmp").exists()
+
+
+def test_add_events_matches_sequential_add_event():
+    """
+    Verifica que `add_events` equivale a `add_event` chamado em sequência.
+
+    Invariantes:
+        - Mesma ordem e mesmo formato de evento
+    """
+    _require_imports()
+    from atlas_dataflow.core.traceability.manifest import add_events
+
+    def _new():
+        return create_manifest(
+            run_id="run-008",
+            started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+            atlas_version="0.0.0",
+            config_hash="c" * 64,
+            contract_hash="d" * 64,
+        )
+
+    ts = datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc)
+    items = [
+        {"event_type": "run_started", "ts": ts},
+        {"event_type": "step_started", "ts": ts, "step_id": "a", "payload": {"kind": "diagnostic"}},
+    ]
+    one, batch = _new(), _new()
+    for it in items:
+        add_event(one, **it)
+    add_events(batch, items)
+    assert batch.to_dict() == one.to_dict()
+
+
+def test_async_writer_never_drops_other_paths(tmp_path):
+    """
+    Verifica que snapshots de paths distintos nunca se descartam entre si.
+
+    Invariantes:
+        - Todo path submetido é gravado com seu snapshot mais recente
+        - `dropped` conta apenas snapshots substituídos do mesmo path
+    """
+    _require_imports()
+    from atlas_dataflow.core.traceability.manifest import AsyncManifestWriter, load_manifest
+
+    m = create_manifest(
+        run_id="run-009",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+    )
+    writer = AsyncManifestWriter(maxsize=1)
+    writer.submit(m, tmp_path / "A.json")
+    for i in range(5):
+        m.run["n"] = i
+        writer.submit(m, tmp_path / "B.json")
+    writer.close()
+
+    assert (tmp_path / "A.json").exists()
+    assert load_manifest(tmp_path / "B.json").run["n"] == 4
+    assert writer.dropped <= 4
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -144,3 +144,167 @@ def test_round_trip_save_load(tmp_path: Path):
     assert d2["inputs"]["config_hash"] == d1["inputs"]["config_hash"]
     assert isinstance(d2["events"], list)
     assert isinstance(d2["steps"], dict)
+
+
+def test_split_round_trip_appends_only_new_events(tmp_path: Path):
+    """
+    Verifica a persistência dividida (`manifest.json` + `events.jsonl`).
+
+    Invariantes:
+        - Snapshots sucessivos anexam apenas eventos novos
+        - `load_manifest_split` reconstrói o mesmo Manifest de `to_dict()`
+    """
+    _require_imports()
+    from atlas_dataflow.core.traceability.manifest import (
+        add_event,
+        load_manifest_split,
+        save_manifest_split,
+    )
+
+    m = create_manifest(
+        run_id="run-005",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+    )
+    ts = datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc)
+    add_event(m, event_type="run_started", ts=ts)
+    save_manifest_split(m, tmp_path)
+    add_event(m, event_type="step_started", ts=ts, step_id="a")
+    save_manifest_split(m, tmp_path)
+
+    lines = (tmp_path / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert "events" not in (tmp_path / "manifest.json").read_text(encoding="utf-8")
+    assert load_manifest_split(tmp_path).to_dict() == m.to_dict()
+
+
+@pytest.mark.parametrize("name,kwargs", [("manifest.json.gz", {}), ("manifest.json", {"compress": True})])
+def test_compressed_round_trip(tmp_path: Path, name, kwargs):
+    """
+    Verifica save/load de Manifest comprimido (detecção por magic bytes).
+
+    Invariantes:
+        - O arquivo gravado não é JSON puro
+        - `load_manifest` restaura o mesmo conteúdo sem indicação de formato
+    """
+    _require_imports()
+    m = create_manifest(
+        run_id="run-006",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+    )
+    out = tmp_path / name
+    save_manifest(m, out, **kwargs)
+
+    assert not out.read_bytes().startswith(b"{")
+    assert load_manifest(out).to_dict() == m.to_dict()
+
+
+def test_compact_save_round_trip(tmp_path: Path):
+    """
+    Verifica que `pretty=False` grava JSON compacto e round-trip equivalente.
+    """
+    _require_imports()
+    m = create_manifest(
+        run_id="run-007",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+    )
+    out = tmp_path / "manifest.json"
+    save_manifest(m, out, pretty=False)
+
+    assert b"\n" not in out.read_bytes()
+    assert load_manifest(out).to_dict() == m.to_dict()
+
+
+def test_throttled_save_skips_until_forced(tmp_path: Path):
+    """
+    Verifica que `min_interval` pula checkpoints próximos e `force` grava sempre.
+    """
+    _require_imports()
+    m = create_manifest(
+        run_id="run-008",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+    )
+    out = tmp_path / "manifest.json"
+    assert save_manifest(m, out, min_interval=3600) is True
+
+    m.run["status"] = "done"
+    assert save_manifest(m, out, min_interval=3600) is False
+    assert "status" not in load_manifest(out).run
+
+    assert save_manifest(m, out, min_interval=3600, force=True, durable=True) is True
+    assert load_manifest(out).to_dict() == m.to_dict()
+    assert not (tmp_path / "manifest.json.tmp").exists()
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_encoding_is_independent_of_orjson(monkeypatch, pretty):
+    """
+    Verifica que os bytes gravados não dependem de o `orjson` estar instalado.
+
+    Invariantes:
+        - Escalares numpy, NaN, floats exponenciais e chaves int são aceitos
+        - A saída com orjson é idêntica à da stdlib
+    """
+    _require_imports()
+    np = pytest.importorskip("numpy")
+    from atlas_dataflow.core.traceability import manifest as mod
+
+    samples = [
+        {"metrics": {"f1": np.float64(0.5), "n": np.int64(3), "w": np.float32(0.1)}},
+        {"x": float("nan"), "y": 1e16, "z": 1e-7, "ok": [0.25, -0.0, None, True, "é"]},
+        {"by_fold": {10: "a", 2: "b"}},
+        {"plain": {"b": [1, 2.5], "a": {}}},
+    ]
+    for data in samples:
+        with_orjson = mod._encode_manifest(data, pretty)
+        monkeypatch.setattr(mod, "orjson", None)
+        assert mod._encode_manifest(data, pretty) == with_orjson
+        monkeypatch.undo()
+
+
+def test_round_trip_with_non_finite_floats(tmp_path: Path):
+    """
+    Verifica que um Manifest com NaN/Infinity gravado pela biblioteca é relido.
+
+    Invariantes:
+        - `save_manifest`/`load_manifest` e a persistência dividida aceitam
+          os literais `NaN`/`Infinity` escritos pelo fallback da stdlib
+    """
+    _require_imports()
+    import math
+
+    from atlas_dataflow.core.traceability.manifest import (
+        add_event,
+        load_manifest_split,
+        save_manifest_split,
+    )
+
+    m = create_manifest(
+        run_id="run-009",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+    )
+    ts = datetime(2026, 1, 16, 12, 0, 1, tzinfo=timezone.utc)
+    add_event(m, event_type="step_finished", ts=ts, step_id="a", payload={"score": float("nan"), "hi": float("inf")})
+
+    out = tmp_path / "manifest.json"
+    save_manifest(m, out)
+    payload = load_manifest(out).events[-1]["payload"]
+    assert math.isnan(payload["score"]) and payload["hi"] == float("inf")
+
+    save_manifest_split(m, tmp_path / "split")
+    payload = load_manifest_split(tmp_path / "split").events[-1]["payload"]
+    assert math.isnan(payload["score"]) and payload["hi"] == float("inf")
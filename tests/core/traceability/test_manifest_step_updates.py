@@ -217,3 +217,49 @@ def test_failed_step_is_recorded():
     s = data["steps"]["train.fit"]
     assert s["status"] in ("failed", getattr(StepStatus, "FAILED", type("X",(object,),{"value":"failed"})) .value)
     assert "error" in s
+
+
+@pytest.mark.parametrize("as_dict", [False, True])
+def test_step_duration_is_exact_for_object_and_dict_manifest(as_dict):
+    """
+    Verifica que `duration_ms` é exato tanto para Manifest objeto quanto dict.
+
+    Invariantes:
+        - A duração independe da representação do Manifest
+        - Nenhum campo interno (cache) vaza para a representação serializável
+    """
+    _require_imports()
+    m = create_manifest(
+        run_id="run-003",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+    )
+    if as_dict:
+        m = m.to_dict()
+    t0 = datetime(2026, 1, 16, 12, 0, 1, tzinfo=timezone.utc)
+    t1 = datetime(2026, 1, 16, 12, 0, 3, 500000, tzinfo=timezone.utc)
+    step_started(m, step_id="ingest.load", kind="diagnostic", ts=t0)
+    step_finished(m, step_id="ingest.load", ts=t1, result={"status": "success", "summary": "ok"})
+
+    data = m if as_dict else m.to_dict()
+    assert data["steps"]["ingest.load"]["duration_ms"] == 2500
+    assert set(data) == {"run", "inputs", "steps", "events"}
+
+
+def test_step_failed_releases_cached_start():
+    """Após `step_failed`, o início em cache do Step é descartado (como em `step_finished`)."""
+    _require_imports()
+    m = create_manifest(
+        run_id="run-004",
+        started_at=datetime(2026, 1, 16, 12, 0, 0, tzinfo=timezone.utc),
+        atlas_version="0.0.0",
+        config_hash="c" * 64,
+        contract_hash="d" * 64,
+    )
+    t0 = datetime(2026, 1, 16, 12, 1, 0, tzinfo=timezone.utc)
+    step_started(m, step_id="train.fit", kind="train", ts=t0)
+    step_failed(m, step_id="train.fit", ts=t0, error="boom")
+
+    assert "train.fit" not in m._started_dt
@@ -47,3 +47,54 @@ def test_purity_renderer_does_not_mutate_input_list():
     before = copy.deepcopy(payload)
     _ = render_payload(payload)
     assert payload == before
+
+
+def test_render_payload_check_purity_flag():
+    payload = {"a": [1, 2], "b": "x"}
+    checked = render_payload(payload, check_purity=True)
+    assert checked == render_payload(payload)
+
+
+def test_render_table_html_rows_fill_missing_keys():
+    html = render_table_html([{"a": 1}, {"b": "<x>"}])
+    assert "<tbody><tr><td>1</td><td></td></tr><tr><td></td><td>&lt;x&gt;</td></tr></tbody>" in html
+
+    kv = render_kv_table_html({"k": "v&w"})
+    assert "<tbody><tr><td><code>k</code></td><td>v&amp;w</td></tr></tbody>" in kv
+
+
+def test_escape_matches_html_escape():
+    import html as _html
+
+    from atlas_dataflow.notebook_ui.renderers import _escape
+
+    for value in ["plain", "a&b", "<t>", "\"q\"", "it's", 42, 1.5, None]:
+        expected = "" if value is None else _html.escape(str(value))
+        assert _escape(value) == expected
+
+
+def test_render_table_html_consumes_only_max_rows():
+    def rows():
+        for i in range(1000):
+            yield {"i": i}
+
+    it = rows()
+    html = render_table_html(it, max_rows=3)
+    assert html.count("<tr><td>") == 3
+    assert next(it) == {"i": 3}
+
+
+def test_is_immutable_detects_nested_mutables():
+    from types import MappingProxyType
+
+    from atlas_dataflow.notebook_ui.renderers import _is_immutable
+
+    assert _is_immutable((1, ("a", None), frozenset({2.0})))
+    assert _is_immutable(MappingProxyType({"a": 1}))
+    assert not _is_immutable((1, [2]))
+    assert not _is_immutable({"a": 1})
+
+
+def test_render_result_has_no_instance_dict():
+    result = render_payload({"a": 1})
+    assert not hasattr(result, "__dict__")